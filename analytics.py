@@ -0,0 +1,276 @@
+"""
+Visitor Analytics
+First-party page-view analytics that never touch the request path. The app
+records one event per page switch into a bounded in-memory queue; a
+background thread drains it in batches into data/analytics.db (SQLite, WAL
+mode) and, in the same transaction, folds the new events into rollup tables:
+
+- daily_page_views: views per day, profile and page
+- sessions: first and last view and view count per visitor session
+
+Each flush rolls up only the events appended since the last rollup (tracked
+in rollup_state), with grouped upserts, so the cost follows the batch and
+not the history. The owner dashboard (/analytics) reads only the rollups.
+
+Set PORTFOLIO_ANALYTICS=0 to record nothing. Days are UTC.
+"""
+
+import atexit
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+from collections import namedtuple
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.environ.get("PORTFOLIO_DATA_DIR", os.path.join(ROOT, "data"))
+ANALYTICS_DB = os.path.join(DATA_DIR, "analytics.db")
+ENABLED = os.environ.get("PORTFOLIO_ANALYTICS", "1") == "1"
+
+QUEUE_SIZE = 10000
+FLUSH_BATCH = 500
+FLUSH_INTERVAL = 5.0
+
+logger = logging.getLogger("portfolio.analytics")
+
+# viewed_at: Unix time; profile: hosted profile ("" for the default site)
+PageView = namedtuple("PageView", "session_id page profile viewed_at")
+DailyViews = namedtuple("DailyViews", "day page views")
+SessionStats = namedtuple("SessionStats", "sessions views average_seconds")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS page_views (
+    id INTEGER PRIMARY KEY,
+    viewed_at REAL NOT NULL,
+    session_id TEXT NOT NULL,
+    page TEXT NOT NULL,
+    profile TEXT NOT NULL DEFAULT ''
+);
+CREATE TABLE IF NOT EXISTS daily_page_views (
+    day TEXT NOT NULL,
+    profile TEXT NOT NULL,
+    page TEXT NOT NULL,
+    views INTEGER NOT NULL,
+    PRIMARY KEY (day, profile, page)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id TEXT PRIMARY KEY,
+    profile TEXT NOT NULL,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL,
+    views INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sessions_first_seen ON sessions (first_seen);
+CREATE TABLE IF NOT EXISTS rollup_state (
+    name TEXT PRIMARY KEY,
+    last_id INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO rollup_state (name, last_id) VALUES ('page_views', 0);
+"""
+
+# Both rollups read only the events in (last_id, new_last_id]
+ROLLUP_DAILY = """
+INSERT INTO daily_page_views (day, profile, page, views)
+SELECT date(viewed_at, 'unixepoch'), profile, page, COUNT(*)
+FROM page_views WHERE id > ? AND id <= ?
+GROUP BY 1, 2, 3
+ON CONFLICT (day, profile, page) DO UPDATE SET views = views + excluded.views
+"""
+
+ROLLUP_SESSIONS = """
+INSERT INTO sessions (session_id, profile, first_seen, last_seen, views)
+SELECT session_id, MIN(profile), MIN(viewed_at), MAX(viewed_at), COUNT(*)
+FROM page_views WHERE id > ? AND id <= ?
+GROUP BY session_id
+ON CONFLICT (session_id) DO UPDATE SET
+    first_seen = MIN(first_seen, excluded.first_seen),
+    last_seen = MAX(last_seen, excluded.last_seen),
+    views = views + excluded.views
+"""
+
+
+def connect(path=ANALYTICS_DB):
+    """Open the analytics database in WAL mode, creating it if needed"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    conn = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def write_batch(conn, batch):
+    """Append events and roll up everything not yet rolled up, atomically"""
+    # IMMEDIATE takes the write lock first, so workers sharing the database
+    # (see proxy.py) never roll up the same events twice
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        conn.executemany(
+            "INSERT INTO page_views (session_id, page, profile, viewed_at) VALUES (?, ?, ?, ?)",
+            batch,
+        )
+        last_id = conn.execute(
+            "SELECT last_id FROM rollup_state WHERE name = 'page_views'"
+        ).fetchone()[0]
+        new_last_id = conn.execute("SELECT COALESCE(MAX(id), 0) FROM page_views").fetchone()[0]
+        conn.execute(ROLLUP_DAILY, (last_id, new_last_id))
+        conn.execute(ROLLUP_SESSIONS, (last_id, new_last_id))
+        conn.execute("UPDATE rollup_state SET last_id = ? WHERE name = 'page_views'", (new_last_id,))
+        conn.execute("COMMIT")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+
+
+class AnalyticsPipeline:
+    """Bounded queue -> batched SQLite writer with incremental rollups"""
+
+    def __init__(self, db_path=ANALYTICS_DB, queue_size=QUEUE_SIZE, flush_interval=FLUSH_INTERVAL):
+        self.db_path = db_path
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._stop = threading.Event()
+        self._writer = threading.Thread(target=self._write_loop, name="analytics-writer", daemon=True)
+
+    def start(self):
+        """Start the background writer"""
+        self._writer.start()
+        return self
+
+    def record(self, session_id, page, profile=""):
+        """Queue a page view; drop it if the queue is full"""
+        try:
+            self._queue.put_nowait(PageView(session_id, page, profile, time.time()))
+        except queue.Full:
+            self.dropped += 1
+            return False
+        return True
+
+    def _drain(self):
+        batch = []
+        while len(batch) < FLUSH_BATCH:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _write_loop(self):
+        conn = None
+        while not (self._stop.is_set() and self._queue.empty()):
+            # Wake up once per interval, or early when a full batch is waiting
+            deadline = time.monotonic() + self.flush_interval
+            while (self._queue.qsize() < FLUSH_BATCH and not self._stop.is_set()
+                   and time.monotonic() < deadline):
+                time.sleep(0.1)
+            batch = self._drain()
+            if not batch:
+                continue
+            try:
+                # (Re)open the database on demand, so a failed open is retried next batch
+                if conn is None:
+                    conn = connect(self.db_path)
+                write_batch(conn, batch)
+            except (sqlite3.Error, OSError):
+                # Analytics are best effort; never let them take the app down
+                self.dropped += len(batch)
+                logger.exception("dropped %d page view(s)", len(batch))
+                if conn is not None:
+                    conn.close()
+                    conn = None
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+        if conn is not None:
+            conn.close()
+
+    def flush(self, timeout=None):
+        """Block until every queued event has been written"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if deadline is not None and time.monotonic() > deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def stop(self, timeout=5.0):
+        """Write what is queued, then stop the writer"""
+        self._stop.set()
+        self._writer.join(timeout)
+
+
+_pipeline = None
+_pipeline_lock = threading.Lock()
+
+
+def get_pipeline():
+    """Return the process-wide analytics pipeline, starting it on first use"""
+    global _pipeline
+    if _pipeline is None:
+        with _pipeline_lock:
+            if _pipeline is None:
+                _pipeline = AnalyticsPipeline().start()
+                atexit.register(_pipeline.stop)
+    return _pipeline
+
+
+def record_page_view(session_id, page, profile=""):
+    """Queue a page view for the background writer; never blocks"""
+    if ENABLED:
+        get_pipeline().record(session_id, page, profile)
+
+
+class AnalyticsStore:
+    """Dashboard queries over the rollup tables"""
+
+    def __init__(self, db_path=ANALYTICS_DB):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = None
+
+    def _connection(self):
+        if self._conn is None:
+            self._conn = connect(self.db_path)
+            self._conn.execute("PRAGMA query_only = ON")
+        return self._conn
+
+    def daily_views(self, since_day, profile=None):
+        """Views per day and page from since_day ("YYYY-MM-DD") on"""
+        sql = "SELECT day, page, SUM(views) FROM daily_page_views WHERE day >= ?"
+        params = [since_day]
+        if profile is not None:
+            sql += " AND profile = ?"
+            params.append(profile)
+        sql += " GROUP BY day, page ORDER BY day, page"
+        with self._lock:
+            rows = self._connection().execute(sql, params).fetchall()
+        return [DailyViews(*row) for row in rows]
+
+    def session_stats(self, since, profile=None):
+        """Sessions started since a Unix time, their views and average length"""
+        sql = ("SELECT COUNT(*), COALESCE(SUM(views), 0), COALESCE(AVG(last_seen - first_seen), 0) "
+               "FROM sessions WHERE first_seen >= ?")
+        params = [since]
+        if profile is not None:
+            sql += " AND profile = ?"
+            params.append(profile)
+        with self._lock:
+            row = self._connection().execute(sql, params).fetchone()
+        return SessionStats(*row)
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_store():
+    """Return the process-wide dashboard reader"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = AnalyticsStore()
+    return _store
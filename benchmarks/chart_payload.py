@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Chart Payload Benchmark
+Starts the app once per chart backend (PORTFOLIO_CHART=svg, bars, plotly)
+and measures what a browser downloads to show the Skills page: the
+websocket messages for the page itself plus any frontend code the backend
+needs (Plotly.js, gzipped, for the plotly backend). Exits non-zero when a
+backend exceeds its budget in benchmarks/budgets.json.
+
+Usage:
+    python benchmarks/chart_payload.py [--json results.json]
+"""
+
+import argparse
+import asyncio
+import glob
+import gzip
+import json
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from st_client import APP, ROOT, StreamlitSession, streamlit_server  # noqa: E402
+
+BUDGETS = os.path.join(ROOT, "benchmarks", "budgets.json")
+# Frontend chunks a backend makes the browser load, as globs under streamlit/static
+FRONTEND_CHUNKS = {"plotly": ["static/js/PlotlyChart.*.js"]}
+
+
+def frontend_bytes(backend):
+    """Gzipped size of the frontend code the browser loads only for this backend"""
+    import streamlit
+
+    static_dir = os.path.join(os.path.dirname(streamlit.__file__), "static")
+    total = 0
+    for pattern in FRONTEND_CHUNKS.get(backend, []):
+        for path in glob.glob(os.path.join(static_dir, pattern)):
+            with open(path, "rb") as f:
+                total += len(gzip.compress(f.read()))
+    return total
+
+
+async def skills_page_bytes(base_url):
+    """Bytes received over the websocket when navigating to the Skills page"""
+    async with StreamlitSession(base_url) as session:
+        await session.rerun()
+        return (await session.goto("Skills")).bytes
+
+
+def load_budgets():
+    """Load the chart payload budgets"""
+    with open(BUDGETS, encoding="utf-8") as f:
+        return json.load(f)["chart_payload_bytes"]
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Compare Skills page payload per chart backend")
+    parser.add_argument("--app", default=APP, help="path to portfolio_app.py")
+    parser.add_argument("--port", type=int, default=8597)
+    parser.add_argument("--json", help="also write results to this file")
+    args = parser.parse_args()
+
+    budgets = load_budgets()
+    base_url = f"http://127.0.0.1:{args.port}"
+    results = {}
+    failures = []
+
+    print(f"{'backend':<10}{'page bytes':>12}{'frontend gz':>14}{'total':>12}{'budget':>12}")
+    for backend in ("svg", "bars", "plotly"):
+        env = {"PORTFOLIO_CHART": backend,
+               "PORTFOLIO_DATA_DIR": tempfile.mkdtemp(prefix="portfolio-chart-")}
+        with streamlit_server(args.port, app=args.app, env=env):
+            page = asyncio.run(skills_page_bytes(base_url))
+        frontend = frontend_bytes(backend)
+        total = page + frontend
+        budget = budgets.get(backend)
+        results[backend] = {"page_bytes": page, "frontend_bytes": frontend, "total_bytes": total}
+        print(f"{backend:<10}{page:>12,}{frontend:>14,}{total:>12,}"
+              f"{'-' if budget is None else f'{budget:,}':>12}")
+        if budget is not None and total > budget:
+            failures.append(f"{backend}: {total:,} bytes > {budget:,} bytes")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    if failures:
+        print("\n❌ Over budget:")
+        for failure in failures:
+            print(f"   {failure}")
+        sys.exit(1)
+    print("\n✅ All chart backends within the payload budget")
+
+
+if __name__ == "__main__":
+    main()
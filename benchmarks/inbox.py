@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Inbox Query Benchmark
+Fills a throwaway contact database with synthetic messages and times the
+inbox queries the Inbox page runs: the first page, a page deep into the
+inbox, a sender's messages, full-text search (common and rare words, alone
+and with a sender) and date filters over dense, sparse and empty ranges.
+Exits non-zero when the slowest query's p95 exceeds the budget in
+benchmarks/budgets.json.
+
+Usage:
+    python benchmarks/inbox.py [--messages 300000] [--json results.json]
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from contact import connect  # noqa: E402
+from inbox import Inbox  # noqa: E402
+
+BUDGETS = os.path.join(ROOT, "benchmarks", "budgets.json")
+WORDS = ("data pipeline spark kafka airflow cloud role contract hiring question "
+         "project consulting warehouse streaming migration dashboard").split()
+SENDERS = 5000
+RARE_EVERY = 10000
+
+
+def fill(db_path, count, seed=1):
+    """Insert count synthetic messages, one in RARE_EVERY mentioning "zebra" """
+    rnd = random.Random(seed)
+    start = time.time() - count * 60
+    conn = connect(db_path)
+    rows = (
+        (f"Visitor {i}", f"visitor{i % SENDERS}@example.com",
+         " ".join(rnd.choices(WORDS, k=4)),
+         " ".join(rnd.choices(WORDS, k=30)) + (" zebra" if i % RARE_EVERY == 0 else ""),
+         start + i * 60, "")
+        for i in range(count)
+    )
+    with conn:
+        conn.executemany(
+            "INSERT INTO messages (name, email, subject, message, submitted_at, profile) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+    conn.close()
+
+
+def scenarios(count):
+    """Named page() keyword arguments to time"""
+    return {
+        "first page": {},
+        "deep page": {"cursor": count // 2},
+        "sender": {"sender": "visitor42@example.com"},
+        "search common": {"search": "kafka"},
+        "search common, deep": {"search": "kafka", "cursor": count // 2},
+        "search rare": {"search": "zebra"},
+        "search 3 words": {"search": "kafka spark hiring"},
+        "search + sender": {"search": "kafka", "sender": "visitor42@example.com"},
+        "last 7 days": {"since": time.time() - 7 * 86400},
+        # Few or no messages in range: must not walk the whole inbox
+        "last 200 s (sparse)": {"since": time.time() - 200},
+        "since now (empty)": {"since": time.time() + 60},
+        "search + sparse range": {"search": "kafka", "since": time.time() - 200},
+    }
+
+
+def time_query(inbox, kwargs, runs):
+    """Milliseconds for each of runs calls of inbox.page(**kwargs)"""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        inbox.page(**kwargs)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def load_budgets():
+    """Load the inbox query budget"""
+    with open(BUDGETS, encoding="utf-8") as f:
+        return json.load(f)["inbox_page_ms"]
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Benchmark inbox page queries")
+    parser.add_argument("--messages", type=int, default=300000, help="synthetic inbox size")
+    parser.add_argument("--runs", type=int, default=50, help="timed calls per query")
+    parser.add_argument("--json", help="also write results to this file")
+    args = parser.parse_args()
+
+    budget = load_budgets()
+    db_path = os.path.join(tempfile.mkdtemp(prefix="portfolio-inbox-"), "contact.db")
+    print(f"📥 Filling an inbox with {args.messages:,} messages...")
+    start = time.perf_counter()
+    fill(db_path, args.messages)
+    print(f"   done in {time.perf_counter() - start:.1f}s\n")
+
+    inbox = Inbox(db_path)
+    results = {}
+    failures = []
+    print(f"{'query':<24}{'p50 ms':>9}{'p95 ms':>9}")
+    for name, kwargs in scenarios(args.messages).items():
+        timings = sorted(time_query(inbox, kwargs, args.runs))
+        p50 = statistics.median(timings)
+        p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+        results[name] = {"p50_ms": round(p50, 3), "p95_ms": round(p95, 3)}
+        print(f"{name:<24}{p50:>9.2f}{p95:>9.2f}")
+        if p95 > budget:
+            failures.append(f"{name}: p95 {p95:.1f} ms > {budget} ms")
+    inbox.close()
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    if failures:
+        print("\n❌ Inbox query budget exceeded:")
+        for failure in failures:
+            print(f"   {failure}")
+        sys.exit(1)
+    print("\n✅ All inbox queries within the budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Concurrent-Session Load Benchmark
+Starts the app under a real Streamlit server and drives N concurrent
+headless sessions through every page and the contact form.
+For each concurrency level it reports p50/p95/p99 rerun latency, messages
+and bytes per rerun, and the server's resident memory per session, and
+writes the results to a JSON file so runs can be compared across commits.
+
+With --url it drives an app that is already running instead, such as
+proxy.py in front of several workers; memory is then not reported.
+
+Usage:
+    python benchmarks/load.py [--sessions 1 10 50] [--out load_results.json]
+    python benchmarks/load.py --url http://127.0.0.1:8501 --sessions 50
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from reruns import CONTACT_FORM  # noqa: E402
+from st_client import APP, ROOT, StreamlitSession, streamlit_server  # noqa: E402
+
+NAVIGATION = ["About", "Experience", "Skills", "Projects", "Contact"]
+
+
+def rss_bytes(pid):
+    """Resident memory of a process, from /proc (Linux only)"""
+    if pid is None:
+        return None
+    try:
+        with open(f"/proc/{pid}/status", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of numbers"""
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+async def session_visit(base_url, rounds, started, release):
+    """One session: load, then visit every page and submit the form"""
+    runs = []
+    async with StreamlitSession(base_url) as session:
+        runs.append(await session.rerun())
+        started.append(session)
+        # Hold every session open until all have connected, so memory is
+        # measured with N sessions alive at once
+        await release.wait()
+        for _ in range(rounds):
+            for title in NAVIGATION:
+                runs.append(await session.goto(title))
+            runs.append(await session.submit_form(CONTACT_FORM, "Send Message"))
+    return runs
+
+
+async def run_level(base_url, server_pid, sessions, rounds):
+    """Run one concurrency level and summarise it"""
+    started = []
+    release = asyncio.Event()
+    baseline_rss = rss_bytes(server_pid)
+    tasks = [asyncio.create_task(session_visit(base_url, rounds, started, release))
+             for _ in range(sessions)]
+    while len(started) < sessions:
+        if any(t.done() for t in tasks):
+            break
+        await asyncio.sleep(0.05)
+    loaded_rss = rss_bytes(server_pid)
+
+    start = time.perf_counter()
+    release.set()
+    results = await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - start
+
+    runs = [run for session_runs in results for run in session_runs]
+    latencies = [run.seconds * 1000 for run in runs]
+    per_session = None
+    if baseline_rss is not None and loaded_rss is not None:
+        per_session = (loaded_rss - baseline_rss) / sessions
+    return {
+        "sessions": sessions,
+        "reruns": len(runs),
+        "reruns_per_second": round(len(runs) / elapsed, 1),
+        "latency_ms": {
+            "p50": round(percentile(latencies, 50), 1),
+            "p95": round(percentile(latencies, 95), 1),
+            "p99": round(percentile(latencies, 99), 1),
+        },
+        "messages_per_rerun": round(statistics.mean(run.messages for run in runs), 1),
+        "bytes_per_rerun": round(statistics.mean(run.bytes for run in runs)),
+        "server_rss_bytes": loaded_rss,
+        "rss_bytes_per_session": None if per_session is None else round(per_session),
+    }
+
+
+def git_commit():
+    """Current commit hash, so result files can be compared across commits"""
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Load-test concurrent portfolio sessions")
+    parser.add_argument("--app", default=APP, help="path to portfolio_app.py")
+    parser.add_argument("--port", type=int, default=8598)
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 10, 50],
+                        help="concurrency levels to run")
+    parser.add_argument("--rounds", type=int, default=2,
+                        help="passes through every page per session")
+    parser.add_argument("--out", default="load_results.json", help="machine-readable results file")
+    parser.add_argument("--url", help="drive this running app instead of starting one")
+    args = parser.parse_args()
+
+    env = {"PORTFOLIO_DATA_DIR": tempfile.mkdtemp(prefix="portfolio-load-")}
+    base_url = args.url or f"http://127.0.0.1:{args.port}"
+    levels = []
+    print(f"{'sessions':>8}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'rerun/s':>9}"
+          f"{'msgs':>7}{'bytes':>9}{'RSS/session':>13}")
+    if args.url:
+        server_context = contextlib.nullcontext()
+    else:
+        server_context = streamlit_server(args.port, app=args.app, env=env)
+    with server_context as server:
+        server_pid = server.pid if server is not None else None
+        # One throwaway visit so lazy imports and caches are not billed to the first level
+        asyncio.run(run_level(base_url, server_pid, 1, 1))
+        for sessions in args.sessions:
+            level = asyncio.run(run_level(base_url, server_pid, sessions, args.rounds))
+            levels.append(level)
+            latency = level["latency_ms"]
+            per_session = level["rss_bytes_per_session"]
+            print(f"{sessions:>8}{latency['p50']:>9.1f}{latency['p95']:>9.1f}{latency['p99']:>9.1f}"
+                  f"{level['reruns_per_second']:>9.1f}{level['messages_per_rerun']:>7.1f}"
+                  f"{level['bytes_per_rerun']:>9,}"
+                  f"{'n/a' if per_session is None else f'{per_session / 1024:,.0f} KiB':>13}")
+
+    report = {
+        "commit": git_commit(),
+        "url": args.url,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "python": platform.python_version(),
+        "rounds": args.rounds,
+        "levels": levels,
+    }
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\n📄 Results written to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
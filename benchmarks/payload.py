@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Page Payload Profiler
+Runs each page of portfolio_app.py headlessly and records every message the
+script sends to the browser: element type, serialized size and the line of
+app code that produced it. Prints the ranked elements per page and the
+source lines that cost the most bytes overall, and exits non-zero when a
+page exceeds its byte or element budget in benchmarks/budgets.json.
+
+Sizes are full ForwardMsg sizes as a first visit receives them, before
+Streamlit's per-session message cache or websocket compression.
+
+Usage:
+    python benchmarks/payload.py [--top 10] [--json results.json]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import traceback
+from collections import defaultdict, namedtuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(ROOT, "portfolio_app.py")
+BUDGETS = os.path.join(ROOT, "benchmarks", "budgets.json")
+PAGES = ["about", "experience", "skills", "projects", "contact"]
+
+# kind: element, block or message type; size: serialized bytes;
+# source: "file:line" of the app code that sent it
+Message = namedtuple("Message", "kind size source")
+
+
+def element_kind(msg):
+    """Element or block type of a delta, or the ForwardMsg type otherwise"""
+    kind = msg.WhichOneof("type")
+    if kind != "delta":
+        return kind
+    delta = msg.delta
+    if delta.WhichOneof("type") == "new_element":
+        return delta.new_element.WhichOneof("type")
+    if delta.WhichOneof("type") == "add_block":
+        return "block:" + (delta.add_block.WhichOneof("type") or "vertical")
+    return delta.WhichOneof("type")
+
+
+def app_source(stack):
+    """Innermost frame in this repository, outside the benchmarks, as "file:line" """
+    for frame in reversed(stack):
+        path = os.path.abspath(frame.filename)
+        if path.startswith(ROOT + os.sep) and os.sep + "benchmarks" + os.sep not in path:
+            return f"{os.path.relpath(path, ROOT)}:{frame.lineno}"
+    return "<streamlit>"
+
+
+class PayloadRecorder:
+    """Records every ForwardMsg a script run enqueues"""
+
+    def __init__(self):
+        self.messages = []
+
+    def install(self):
+        """Wrap ScriptRunContext.enqueue so each message is recorded with its source"""
+        from streamlit.runtime.scriptrunner_utils.script_run_context import ScriptRunContext
+
+        enqueue = ScriptRunContext.enqueue
+        recorder = self
+
+        def recording_enqueue(ctx, msg):
+            recorder.messages.append(
+                Message(element_kind(msg), msg.ByteSize(), app_source(traceback.extract_stack()[:-1]))
+            )
+            return enqueue(ctx, msg)
+
+        ScriptRunContext.enqueue = recording_enqueue
+
+    def profile(self, page):
+        """Run one page in a fresh AppTest and return its messages"""
+        from streamlit.testing.v1 import AppTest
+
+        at = AppTest.from_file(APP, default_timeout=60)
+        if page != "about":
+            at.switch_page(f"views/{page}.py")
+        self.messages = []
+        at.run()
+        if at.exception:
+            raise RuntimeError(f"{page}: {at.exception[0].message}")
+        return list(self.messages)
+
+
+def summarize(messages):
+    """Totals for one page: bytes, element count and messages ranked by size"""
+    elements = [m for m in messages if m.kind not in ("script_finished", "new_session")]
+    return {
+        "bytes": sum(m.size for m in messages),
+        "elements": sum(1 for m in elements if not m.kind.startswith("block:")),
+        "messages": len(messages),
+        "ranked": sorted(messages, key=lambda m: m.size, reverse=True),
+    }
+
+
+def by_source(pages):
+    """Bytes and message counts per source line, across all pages, largest first"""
+    totals = defaultdict(lambda: [0, 0, set()])
+    for messages in pages.values():
+        for m in messages:
+            entry = totals[m.source]
+            entry[0] += m.size
+            entry[1] += 1
+            entry[2].add(m.kind)
+    return sorted(totals.items(), key=lambda item: item[1][0], reverse=True)
+
+
+def load_budgets():
+    """Load the per-page payload budgets"""
+    with open(BUDGETS, encoding="utf-8") as f:
+        return json.load(f)["page_payload"]
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Profile the messages each page sends")
+    parser.add_argument("--top", type=int, default=10, help="largest messages to list per page")
+    parser.add_argument("--json", help="also write results to this file")
+    args = parser.parse_args()
+
+    # Keep page views and messages out of the owner's data/ databases
+    os.environ["PORTFOLIO_DATA_DIR"] = tempfile.mkdtemp(prefix="portfolio-payload-")
+    sys.path.insert(0, ROOT)
+    budgets = load_budgets()
+    recorder = PayloadRecorder()
+    recorder.install()
+    pages = {page: recorder.profile(page) for page in PAGES}
+
+    results = {}
+    failures = []
+    for page, messages in pages.items():
+        summary = summarize(messages)
+        budget = budgets.get(page, budgets["default"])
+        print(f"\n📄 {page}: {summary['bytes']:,} bytes, {summary['elements']} elements "
+              f"(budget {budget['bytes']:,} bytes, {budget['elements']} elements)")
+        print(f"   {'bytes':>8}  {'type':<16}source")
+        for m in summary["ranked"][:args.top]:
+            print(f"   {m.size:>8,}  {m.kind:<16}{m.source}")
+
+        results[page] = {
+            "bytes": summary["bytes"],
+            "elements": summary["elements"],
+            "messages": [m._asdict() for m in summary["ranked"]],
+        }
+        if summary["bytes"] > budget["bytes"]:
+            failures.append(f"{page}: {summary['bytes']:,} bytes > {budget['bytes']:,} bytes")
+        if summary["elements"] > budget["elements"]:
+            failures.append(f"{page}: {summary['elements']} elements > {budget['elements']} elements")
+
+    print("\n🔎 Costliest source lines across all pages")
+    print(f"   {'bytes':>8}{'msgs':>6}  {'source':<32}types")
+    for source, (size, count, kinds) in by_source(pages)[:args.top]:
+        print(f"   {size:>8,}{count:>6}  {source:<32}{', '.join(sorted(kinds))}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    if failures:
+        print("\n❌ Payload budget exceeded:")
+        for failure in failures:
+            print(f"   {failure}")
+        sys.exit(1)
+    print("\n✅ All pages within the payload budget")
+
+
+if __name__ == "__main__":
+    main()
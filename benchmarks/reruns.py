@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Rerun Cost Benchmark
+Starts the app under a real Streamlit server and replays a short visit over
+the websocket protocol: first load, navigating to Contact, submitting the
+contact form and navigating to Skills. For each interaction it reports the
+rerun time and the messages and bytes the browser receives. Run it before
+and after a change (use --app to point at another checkout) to compare.
+
+Usage:
+    python benchmarks/reruns.py [--repeat 5] [--json results.json]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from st_client import APP, StreamlitSession, streamlit_server  # noqa: E402
+
+CONTACT_FORM = {
+    "Name": "Benchmark",
+    "Email": "bench@example.com",
+    "Subject": "Rerun benchmark",
+    "Message": "Measuring fragment reruns.",
+}
+
+
+async def visit(base_url):
+    """Replay one visit; return {interaction: RunStats}"""
+    async with StreamlitSession(base_url) as session:
+        results = {"first load": await session.rerun()}
+        results["navigate: Contact"] = await session.goto("Contact")
+        results["submit contact form"] = await session.submit_form(CONTACT_FORM, "Send Message")
+        results["navigate: Skills"] = await session.goto("Skills")
+        return results
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Measure rerun time and payload per interaction")
+    parser.add_argument("--app", default=APP, help="path to portfolio_app.py")
+    parser.add_argument("--port", type=int, default=8599)
+    parser.add_argument("--repeat", type=int, default=5, help="visits to replay (medians are reported)")
+    parser.add_argument("--json", help="also write results to this file")
+    args = parser.parse_args()
+
+    env = {"PORTFOLIO_DATA_DIR": tempfile.mkdtemp(prefix="portfolio-bench-")}
+    base_url = f"http://127.0.0.1:{args.port}"
+    with streamlit_server(args.port, app=args.app, env=env):
+        visits = [asyncio.run(visit(base_url)) for _ in range(args.repeat)]
+
+    summary = {}
+    print(f"{'interaction':<24}{'rerun ms':>10}{'messages':>10}{'bytes':>10}")
+    for interaction in visits[0]:
+        runs = [v[interaction] for v in visits]
+        summary[interaction] = {
+            "rerun_ms": round(statistics.median(r.seconds for r in runs) * 1000, 1),
+            "messages": statistics.median(r.messages for r in runs),
+            "bytes": statistics.median(r.bytes for r in runs),
+        }
+        row = summary[interaction]
+        print(f"{interaction:<24}{row['rerun_ms']:>10.1f}{row['messages']:>10.0f}{row['bytes']:>10,.0f}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
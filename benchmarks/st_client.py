@@ -0,0 +1,178 @@
+"""
+Headless Streamlit Client
+A minimal websocket client that speaks Streamlit's BackMsg/ForwardMsg
+protocol, so benchmarks can drive real sessions against a running server
+and measure what a browser would receive: messages, bytes and elements per
+rerun, including fragment-scoped reruns and page navigation.
+"""
+
+import asyncio
+import os
+import subprocess
+import sys
+import time
+import urllib.request
+from collections import namedtuple
+from contextlib import contextmanager
+
+import websockets
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(ROOT, "portfolio_app.py")
+
+# element: element or block type; size: serialized ForwardMsg bytes;
+# path: delta path in the element tree; fragment_id: owning fragment, if any
+Delta = namedtuple("Delta", "element size path fragment_id")
+RunStats = namedtuple("RunStats", "seconds messages bytes deltas")
+Widget = namedtuple("Widget", "id type fragment_id form_id")
+
+WIDGET_TYPES = {"button", "text_input", "text_area", "checkbox", "selectbox",
+                "radio", "number_input", "button_group"}
+
+
+@contextmanager
+def streamlit_server(port, app=APP, env=None, startup_timeout=60):
+    """Run `streamlit run app` on port for the duration of the block"""
+    process = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", app,
+         f"--server.port={port}", "--server.headless=true",
+         "--browser.gatherUsageStats=false", "--server.fileWatcherType=none"],
+        cwd=os.path.dirname(os.path.abspath(app)),
+        env=dict(os.environ, **(env or {})),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        wait_until_healthy(f"http://127.0.0.1:{port}/_stcore/health", startup_timeout)
+        yield process
+    finally:
+        process.terminate()
+        try:
+            process.wait(10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def wait_until_healthy(url, timeout):
+    """Poll a health endpoint until it answers 200 or timeout expires"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(url, timeout=1) as response:
+                if response.status == 200:
+                    return
+        except OSError:
+            pass
+        time.sleep(0.2)
+    raise TimeoutError(f"{url} not healthy after {timeout}s")
+
+
+class StreamlitSession:
+    """One browser-like session over the /_stcore/stream websocket"""
+
+    def __init__(self, base_url):
+        self.url = base_url.replace("http", "ws", 1).rstrip("/") + "/_stcore/stream"
+        self.widgets = {}  # label -> Widget
+        self.pages = {}    # page title -> page script hash
+        self.page_script_hash = ""
+        self._ws = None
+
+    async def connect(self):
+        self._ws = await websockets.connect(self.url, subprotocols=["streamlit"], max_size=None)
+        return self
+
+    async def close(self):
+        if self._ws is not None:
+            await self._ws.close()
+
+    async def __aenter__(self):
+        return await self.connect()
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def rerun(self, widget_values=None, fragment_id="", query_string="", page_name="",
+                    page_script_hash=None):
+        """Request a rerun and collect everything sent until the script finishes"""
+        back = BackMsg()
+        state = back.rerun_script
+        state.query_string = query_string
+        if page_script_hash is None:
+            page_script_hash = "" if page_name else self.page_script_hash
+        state.page_script_hash = page_script_hash
+        state.page_name = page_name
+        state.fragment_id = fragment_id
+        for widget_id, value in (widget_values or {}).items():
+            widget = state.widget_states.widgets.add()
+            widget.id = widget_id
+            if value is True and widget_id in self._triggers():
+                widget.trigger_value = True
+            elif isinstance(value, bool):
+                widget.bool_value = value
+            elif isinstance(value, int):
+                widget.int_value = value
+            else:
+                widget.string_value = str(value)
+
+        start = time.perf_counter()
+        await self._ws.send(back.SerializeToString())
+        messages = 0
+        total = 0
+        deltas = []
+        while True:
+            data = await self._ws.recv()
+            messages += 1
+            total += len(data)
+            msg = ForwardMsg()
+            msg.ParseFromString(data)
+            kind = msg.WhichOneof("type")
+            if kind == "new_session":
+                self.page_script_hash = msg.new_session.page_script_hash
+            elif kind == "navigation":
+                self.page_script_hash = msg.navigation.page_script_hash
+                self.pages = {page.page_name: page.page_script_hash
+                              for page in msg.navigation.app_pages}
+            elif kind == "delta":
+                deltas.append(self._record(msg, len(data)))
+            elif kind == "script_finished":
+                break
+        return RunStats(time.perf_counter() - start, messages, total, deltas)
+
+    def _triggers(self):
+        return {w.id for w in self.widgets.values() if w.type == "button"}
+
+    def _record(self, msg, size):
+        delta = msg.delta
+        kind = delta.WhichOneof("type")
+        element = kind
+        if kind == "new_element":
+            element = delta.new_element.WhichOneof("type")
+            if element in WIDGET_TYPES:
+                proto = getattr(delta.new_element, element)
+                label = getattr(proto, "label", "") or proto.id
+                self.widgets[label] = Widget(proto.id, element, delta.fragment_id,
+                                             getattr(proto, "form_id", ""))
+        return Delta(element, size, tuple(msg.metadata.delta_path), delta.fragment_id)
+
+    async def click(self, label):
+        """Click a button (or form submit button) by its label"""
+        widget = self.widgets[label]
+        return await self.rerun({widget.id: True}, fragment_id=widget.fragment_id)
+
+    async def goto(self, title):
+        """Navigate to a page by its title, as clicking its page link would"""
+        return await self.rerun(page_script_hash=self.pages[title])
+
+    async def submit_form(self, values, submit_label):
+        """Fill in form fields by label and press the form's submit button"""
+        submit = self.widgets[submit_label]
+        widget_values = {self.widgets[label].id: value for label, value in values.items()}
+        widget_values[submit.id] = True
+        return await self.rerun(widget_values, fragment_id=submit.fragment_id)
+
+
+def run(coro):
+    """Run a coroutine to completion from synchronous code"""
+    return asyncio.run(coro)
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Cold-Start Benchmark
+Measures, in a fresh interpreter per page, how long the app's imports take
+and how long the first render of each page takes. Exits non-zero when any
+measurement exceeds the budget in benchmarks/budgets.json.
+
+Usage:
+    python benchmarks/startup.py [--runs 3] [--json results.json]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(ROOT, "portfolio_app.py")
+BUDGETS = os.path.join(ROOT, "benchmarks", "budgets.json")
+PAGES = ["about", "experience", "skills", "projects", "contact"]
+
+# Runs inside the child interpreter; prints one JSON line of timings
+CHILD = r"""
+import json, sys, time
+sys.path.insert(0, {root!r})
+start = time.perf_counter()
+import streamlit
+import charts, content, render
+imported = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file({app!r}, default_timeout=60)
+if {page!r} != "about":
+    at.switch_page("views/" + {page!r} + ".py")
+ready = time.perf_counter()
+at.run()
+rendered = time.perf_counter()
+if at.exception:
+    raise SystemExit(str(at.exception))
+print(json.dumps({{
+    "import_ms": (imported - start) * 1000,
+    "first_render_ms": (rendered - ready) * 1000,
+    "heavy_modules": sorted(m for m in ("pandas", "plotly.express") if m in sys.modules),
+}}))
+"""
+
+
+def measure(page, data_dir):
+    """Run one cold start of a page in a child interpreter"""
+    code = CHILD.format(root=ROOT, app=APP, page=page)
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True,
+        env=dict(os.environ, PORTFOLIO_DATA_DIR=data_dir),
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"{page}: {result.stderr.strip() or result.stdout.strip()}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def load_budgets():
+    """Load the cold-start budgets"""
+    with open(BUDGETS, encoding="utf-8") as f:
+        return json.load(f)["startup"]
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Benchmark cold start per page")
+    parser.add_argument("--runs", type=int, default=3, help="cold starts per page (median is reported)")
+    parser.add_argument("--json", help="also write results to this file")
+    args = parser.parse_args()
+
+    budgets = load_budgets()
+    # Keep page views out of the owner's data/analytics.db
+    data_dir = tempfile.mkdtemp(prefix="portfolio-startup-")
+    results = {}
+    failures = []
+
+    print(f"{'page':<12}{'import ms':>12}{'render ms':>12}  heavy modules loaded")
+    for page in PAGES:
+        runs = [measure(page, data_dir) for _ in range(args.runs)]
+        import_ms = statistics.median(run["import_ms"] for run in runs)
+        render_ms = statistics.median(run["first_render_ms"] for run in runs)
+        heavy = runs[-1]["heavy_modules"]
+        results[page] = {"import_ms": round(import_ms, 1), "first_render_ms": round(render_ms, 1),
+                         "heavy_modules": heavy}
+        print(f"{page:<12}{import_ms:>12.1f}{render_ms:>12.1f}  {', '.join(heavy) or '-'}")
+
+        if import_ms > budgets["import_ms"]:
+            failures.append(f"{page}: import {import_ms:.0f} ms > {budgets['import_ms']} ms")
+        page_budget = budgets["first_render_ms"].get(page, budgets["first_render_ms"]["default"])
+        if render_ms > page_budget:
+            failures.append(f"{page}: first render {render_ms:.0f} ms > {page_budget} ms")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    if failures:
+        print("\n❌ Cold-start budget exceeded:")
+        for failure in failures:
+            print(f"   {failure}")
+        sys.exit(1)
+    print("\n✅ All pages within the cold-start budget")
+
+
+if __name__ == "__main__":
+    main()
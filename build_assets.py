@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Asset Build
+Generates the portfolio's image assets: the initials placeholder and the
+resized profile photo variants. A manifest records a hash of each asset's
+inputs (text, colours, size, font, source image), so only assets whose
+inputs changed or whose outputs are missing are rebuilt. Independent assets
+in the same stage are built in parallel.
+
+Usage:
+    python build_assets.py [--force]
+"""
+
+import argparse
+import json
+import os
+import sys
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from content import content_hash, load_content
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+MANIFEST_PATH = os.path.join(ROOT, ".asset-manifest.json")
+
+PLACEHOLDER_PATH = os.path.join(ROOT, "profile_placeholder.jpg")
+PLACEHOLDER_STYLE = {
+    "size": [400, 400],
+    "background": "#3498db",
+    "foreground": "white",
+    "font_size": 120,
+}
+# Fonts tried in order before falling back to Pillow's built-in bitmap font
+FONT_CANDIDATES = ("arial.ttf", "/System/Library/Fonts/Arial.ttf", "DejaVuSans.ttf")
+
+# name: asset label; outputs: paths it writes; inputs: everything that
+# affects the result; build: callable producing the outputs
+Asset = namedtuple("Asset", "name outputs inputs build")
+
+
+def _load_font(size):
+    """Return (font, font name) for the first available candidate"""
+    from PIL import ImageFont
+
+    for candidate in FONT_CANDIDATES:
+        try:
+            return ImageFont.truetype(candidate, size), candidate
+        except OSError:
+            continue
+    return ImageFont.load_default(), "default"
+
+
+def render_initials(path, text, style):
+    """Draw centred initials on a solid background and save as JPEG"""
+    from PIL import Image, ImageDraw
+
+    size = tuple(style["size"])
+    img = Image.new('RGB', size, color=style["background"])
+    draw = ImageDraw.Draw(img)
+    font, _ = _load_font(style["font_size"])
+
+    bbox = draw.textbbox((0, 0), text, font=font)
+    text_width = bbox[2] - bbox[0]
+    text_height = bbox[3] - bbox[1]
+    x = (size[0] - text_width) // 2 - bbox[0]
+    y = (size[1] - text_height) // 2 - bbox[1]
+
+    draw.text((x, y), text, fill=style["foreground"], font=font)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    img.save(tmp_path, 'JPEG')
+    os.replace(tmp_path, path)
+
+
+def placeholder_asset(profile):
+    """Describe the initials placeholder image"""
+    inputs = dict(PLACEHOLDER_STYLE, text=profile["initials"],
+                  font=_load_font(PLACEHOLDER_STYLE["font_size"])[1])
+    return Asset(
+        "profile placeholder",
+        [PLACEHOLDER_PATH],
+        inputs,
+        lambda: render_initials(PLACEHOLDER_PATH, inputs["text"], PLACEHOLDER_STYLE),
+    )
+
+
+def variant_assets():
+    """Describe each resized variant of the current profile image, if any"""
+    import images
+
+    for name in images.PROFILE_SOURCES:
+        source = os.path.join(ROOT, name)
+        if os.path.exists(source):
+            break
+    else:
+        return []
+    digest = images.file_digest(source)
+    options = {ext: [fmt, opts] for ext, fmt, _, opts in images.VARIANT_FORMATS}
+    return [
+        Asset(
+            f"{name} {variant.width}px {variant.ext}",
+            [variant.path],
+            {"source": name, "digest": digest, "width": variant.width,
+             "format": options[variant.ext]},
+            lambda variant=variant: images.write_variant(source, variant),
+        )
+        for variant in images.variant_paths(source, digest)
+    ]
+
+
+def load_manifest(path=MANIFEST_PATH):
+    """Load the manifest of previously built assets"""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def save_manifest(manifest, path=MANIFEST_PATH):
+    """Write the manifest atomically"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def is_up_to_date(asset, manifest):
+    """Return True when the asset's inputs are unchanged and its outputs exist"""
+    entry = manifest.get(asset.name)
+    return (
+        entry is not None
+        and entry["inputs"] == content_hash(asset.inputs)
+        and all(os.path.exists(path) for path in asset.outputs)
+    )
+
+
+def _build_stage(assets, manifest, force, max_workers):
+    """Build the stale assets of one stage in parallel; return (name, status) pairs"""
+    stale = [a for a in assets if force or not is_up_to_date(a, manifest)]
+    results = [(a.name, "up to date") for a in assets if a not in stale]
+    if stale:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {pool.submit(a.build): a for a in stale}
+            for future, asset in futures.items():
+                future.result()
+                manifest[asset.name] = {
+                    "inputs": content_hash(asset.inputs),
+                    "outputs": [os.path.relpath(p, ROOT) for p in asset.outputs],
+                }
+                results.append((asset.name, "built"))
+    return results
+
+
+def build_assets(force=False, max_workers=None):
+    """Bring every asset up to date; return (name, status) pairs"""
+    manifest = load_manifest()
+    before = dict(manifest)
+    profile = load_content().profile
+
+    # Stages run in order because variants are resized from the placeholder
+    # when there is no profile photo; assets within a stage are independent
+    # and built in parallel.
+    stages = [
+        lambda: [placeholder_asset(profile)],
+        variant_assets,
+    ]
+    results = []
+    for stage in stages:
+        results.extend(_build_stage(stage(), manifest, force, max_workers))
+
+    if manifest != before:
+        save_manifest(manifest)
+    return results
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Build portfolio image assets")
+    parser.add_argument("--force", action="store_true", help="rebuild every asset")
+    args = parser.parse_args()
+
+    try:
+        results = build_assets(force=args.force)
+    except ImportError:
+        print("⚠️  Pillow not installed. Install with: pip install Pillow")
+        sys.exit(1)
+    for name, status in results:
+        print(f"{'✅' if status == 'built' else '⏭️ '} {name}: {status}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""
+Portfolio Charts
+Builds the app's charts with one of three backends, chosen per deployment
+with PORTFOLIO_CHART:
+
+- svg (default): a prerendered SVG, a few kilobytes in the page
+- bars: a minimal HTML/CSS bar chart, the smallest payload
+- plotly: an interactive Plotly figure; browsers also download Plotly.js,
+  several megabytes, the first time a chart is shown
+
+Each chart registers one builder per backend in CHARTS. Charts are memoized
+process-wide on a hash of their data in a bounded LRU, so the work happens
+once per distinct dataset rather than per visit.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from html import escape
+
+from content import content_hash
+
+CHART_BACKENDS = ("svg", "bars", "plotly")
+CHART_MODE = os.environ.get("PORTFOLIO_CHART", "svg").lower()
+if CHART_MODE not in CHART_BACKENDS:
+    raise ValueError(f"PORTFOLIO_CHART must be one of {', '.join(CHART_BACKENDS)}, not '{CHART_MODE}'")
+
+# Distinct charts kept in memory, least recently used evicted first
+CHART_CACHE_SIZE = 256
+
+# Plotly's sequential "Blues" scale, so the SVG matches the interactive chart
+BLUES = [
+    (247, 251, 255), (222, 235, 247), (198, 219, 239), (158, 202, 225),
+    (107, 174, 214), (66, 146, 198), (33, 113, 181), (8, 81, 156), (8, 48, 107),
+]
+
+
+def proficiency_figure(proficiency_data):
+    """Build the interactive horizontal bar chart of skill proficiency"""
+    # pandas and Plotly are imported here so pages without the chart never pay for them
+    import pandas as pd
+    import plotly.express as px
+
+    df = pd.DataFrame(proficiency_data)
+    fig = px.bar(df, x='Proficiency', y='Skill', orientation='h',
+                 color='Proficiency', color_continuous_scale='Blues')
+    fig.update_layout(height=400, showlegend=False,
+                      plot_bgcolor='rgba(0,0,0,0)',
+                      paper_bgcolor='rgba(0,0,0,0)')
+    return fig
+
+
+def _blues(fraction):
+    """Interpolate a colour on the Blues scale for a value in [0, 1]"""
+    position = max(0.0, min(1.0, fraction)) * (len(BLUES) - 1)
+    low = int(position)
+    high = min(low + 1, len(BLUES) - 1)
+    t = position - low
+    r, g, b = (round(a + (c - a) * t) for a, c in zip(BLUES[low], BLUES[high]))
+    return f"rgb({r},{g},{b})"
+
+
+def proficiency_svg(proficiency_data, width=420, height=400):
+    """Render the proficiency chart as a standalone SVG string"""
+    skills = proficiency_data['Skill']
+    values = proficiency_data['Proficiency']
+    lowest, highest = min(values), max(values)
+    spread = (highest - lowest) or 1
+
+    label_width = 120
+    top, bottom = 10, 30
+    plot_width = width - label_width - 20
+    row_height = (height - top - bottom) / max(len(skills), 1)
+    scale_max = max(100, highest)
+
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {width} {height}" '
+        f'width="100%" role="img" aria-label="Skills proficiency" '
+        f'font-family="sans-serif" font-size="12">'
+    ]
+    # Plotly draws the first category at the bottom of a horizontal bar chart
+    for row, (skill, value) in enumerate(reversed(list(zip(skills, values)))):
+        y = top + row * row_height
+        bar_width = plot_width * value / scale_max
+        colour = _blues((value - lowest) / spread)
+        parts.append(
+            f'<text x="{label_width - 8}" y="{y + row_height / 2:.1f}" '
+            f'text-anchor="end" dominant-baseline="middle" fill="#2c3e50">{escape(str(skill))}</text>'
+            f'<rect x="{label_width}" y="{y + row_height * 0.1:.1f}" '
+            f'width="{bar_width:.1f}" height="{row_height * 0.8:.1f}" fill="{colour}">'
+            f'<title>{escape(str(skill))}: {value}</title></rect>'
+        )
+    for tick in range(0, scale_max + 1, 20):
+        x = label_width + plot_width * tick / scale_max
+        parts.append(
+            f'<text x="{x:.1f}" y="{height - 10}" text-anchor="middle" fill="#666">{tick}</text>'
+        )
+    parts.append('</svg>')
+    return "".join(parts)
+
+
+def proficiency_bars_html(proficiency_data):
+    """Render the proficiency chart as plain HTML bars styled by the global stylesheet"""
+    skills = proficiency_data['Skill']
+    values = proficiency_data['Proficiency']
+    lowest, highest = min(values), max(values)
+    spread = (highest - lowest) or 1
+    scale_max = max(100, highest)
+    rows = "".join(
+        f'<div class="bar-row"><span class="bar-label">{escape(str(skill))}</span>'
+        f'<span class="bar-track"><span class="bar-fill" style="width:{100 * value / scale_max:.1f}%;'
+        f'background:{_blues((value - lowest) / spread)}"></span></span>'
+        f'<span class="bar-value">{value}</span></div>'
+        for skill, value in zip(skills, values)
+    )
+    return f'<div class="bar-chart" role="img" aria-label="Skills proficiency">{rows}</div>'
+
+
+# Chart name -> {backend: builder}; every builder but Plotly's returns HTML
+CHARTS = {
+    "proficiency": {
+        "svg": proficiency_svg,
+        "bars": proficiency_bars_html,
+        "plotly": proficiency_figure,
+    },
+}
+
+
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _memoized(builder, data):
+    key = (builder.__name__, content_hash(data))
+    with _cache_lock:
+        chart = _cache.get(key)
+        if chart is None:
+            chart = _cache[key] = builder(data)
+            if len(_cache) > CHART_CACHE_SIZE:
+                _cache.popitem(last=False)
+        else:
+            _cache.move_to_end(key)
+    return chart
+
+
+def build_chart(name, data, backend=None):
+    """Return the shared chart for this dataset; treat Plotly figures as read-only"""
+    return _memoized(CHARTS[name][backend or CHART_MODE], data)
+
+
+def show_chart(name, data, backend=None):
+    """Send a chart to the current Streamlit page using the deployment's backend"""
+    import streamlit as st
+
+    chart = build_chart(name, data, backend)
+    if (backend or CHART_MODE) == "plotly":
+        st.plotly_chart(chart, use_container_width=True)
+    else:
+        st.markdown(chart, unsafe_allow_html=True)
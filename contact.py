@@ -0,0 +1,391 @@
+"""
+Contact Form Pipeline
+Stores contact form submissions without blocking the visitor's rerun. The
+form callback only puts the submission on a bounded in-memory queue; a
+background writer thread drains it in batches into a SQLite database in WAL
+mode. When SMTP is configured, a second thread mails undelivered messages
+in batches over a reused connection, so a slow disk or mail server never
+stalls a page.
+
+SMTP delivery is enabled by setting PORTFOLIO_SMTP_HOST. Related settings:
+PORTFOLIO_SMTP_PORT (default 587), PORTFOLIO_SMTP_USER,
+PORTFOLIO_SMTP_PASSWORD, PORTFOLIO_SMTP_STARTTLS (default 1),
+PORTFOLIO_SMTP_FROM and PORTFOLIO_SMTP_TO.
+"""
+
+import atexit
+import logging
+import os
+import queue
+import smtplib
+import sqlite3
+import threading
+import time
+from collections import namedtuple
+from email.message import EmailMessage
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.environ.get("PORTFOLIO_DATA_DIR", os.path.join(ROOT, "data"))
+CONTACT_DB = os.path.join(DATA_DIR, "contact.db")
+
+QUEUE_SIZE = 1000
+WRITE_BATCH = 100
+MAIL_BATCH = 50
+MAIL_INTERVAL = 5.0
+# Close an idle SMTP connection after this many seconds
+SMTP_IDLE_TIMEOUT = 60.0
+# A claim older than this belongs to a mailer that died mid-send; retry it
+CLAIM_TIMEOUT = 600.0
+
+logger = logging.getLogger("portfolio.contact")
+
+# profile: the hosted profile the message is for ("" for the default site)
+Submission = namedtuple("Submission", "name email subject message submitted_at profile")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS messages (
+    id INTEGER PRIMARY KEY,
+    submitted_at REAL NOT NULL,
+    name TEXT NOT NULL,
+    email TEXT NOT NULL,
+    subject TEXT NOT NULL,
+    message TEXT NOT NULL,
+    delivered INTEGER NOT NULL DEFAULT 0,
+    profile TEXT NOT NULL DEFAULT '',
+    claimed_at REAL NOT NULL DEFAULT 0
+);
+"""
+
+# messages.delivered: not yet mailed, mailed, or claimed by a mailer that is sending it
+PENDING, DELIVERED, SENDING = 0, 1, 2
+
+# Created after the profile column migration; the inbox pages by id with these
+INDEXES = """
+CREATE INDEX IF NOT EXISTS messages_submitted_at ON messages (submitted_at);
+CREATE INDEX IF NOT EXISTS messages_email ON messages (email);
+CREATE INDEX IF NOT EXISTS messages_profile ON messages (profile);
+"""
+
+# Full-text index over subject and message, kept in sync by triggers
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS messages_fts USING fts5(
+    subject, message, content='messages', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS messages_fts_insert AFTER INSERT ON messages BEGIN
+    INSERT INTO messages_fts (rowid, subject, message) VALUES (new.id, new.subject, new.message);
+END;
+CREATE TRIGGER IF NOT EXISTS messages_fts_delete AFTER DELETE ON messages BEGIN
+    INSERT INTO messages_fts (messages_fts, rowid, subject, message)
+    VALUES ('delete', old.id, old.subject, old.message);
+END;
+CREATE TRIGGER IF NOT EXISTS messages_fts_update AFTER UPDATE OF subject, message ON messages BEGIN
+    INSERT INTO messages_fts (messages_fts, rowid, subject, message)
+    VALUES ('delete', old.id, old.subject, old.message);
+    INSERT INTO messages_fts (rowid, subject, message) VALUES (new.id, new.subject, new.message);
+END;
+"""
+
+
+def connect(path=CONTACT_DB):
+    """Open the contact database in WAL mode, creating it if needed"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(SCHEMA)
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(messages)")}
+    if "profile" not in columns:
+        # Databases created before multi-profile hosting
+        conn.execute("ALTER TABLE messages ADD COLUMN profile TEXT NOT NULL DEFAULT ''")
+    if "claimed_at" not in columns:
+        # Databases created before several workers shared one database
+        conn.execute("ALTER TABLE messages ADD COLUMN claimed_at REAL NOT NULL DEFAULT 0")
+    conn.executescript(INDEXES)
+    create_fts(conn)
+    return conn
+
+
+def has_fts(conn):
+    """Whether the full-text index exists in this database"""
+    return conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'messages_fts'"
+    ).fetchone() is not None
+
+
+def create_fts(conn):
+    """Create the full-text index, filling it from existing messages; skip without FTS5"""
+    if has_fts(conn):
+        return
+    try:
+        with conn:
+            conn.executescript(FTS_SCHEMA)
+            conn.execute("INSERT INTO messages_fts (messages_fts) VALUES ('rebuild')")
+    except sqlite3.OperationalError:
+        # SQLite built without FTS5; the inbox falls back to LIKE search
+        pass
+
+
+class SmtpSender:
+    """Sends batches of messages over one SMTP connection, reused between batches"""
+
+    def __init__(self, host, port=587, username=None, password=None,
+                 starttls=True, sender=None, recipient=None, timeout=30):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.starttls = starttls
+        self.sender = sender or username
+        self.recipient = recipient or self.sender
+        self.timeout = timeout
+        self._smtp = None
+        self._last_used = 0.0
+
+    @classmethod
+    def from_env(cls):
+        """Build a sender from PORTFOLIO_SMTP_* variables, or None if unset"""
+        host = os.environ.get("PORTFOLIO_SMTP_HOST")
+        if not host:
+            return None
+        return cls(
+            host,
+            port=int(os.environ.get("PORTFOLIO_SMTP_PORT", "587")),
+            username=os.environ.get("PORTFOLIO_SMTP_USER"),
+            password=os.environ.get("PORTFOLIO_SMTP_PASSWORD"),
+            starttls=os.environ.get("PORTFOLIO_SMTP_STARTTLS", "1") == "1",
+            sender=os.environ.get("PORTFOLIO_SMTP_FROM"),
+            recipient=os.environ.get("PORTFOLIO_SMTP_TO"),
+        )
+
+    def _connection(self):
+        if self._smtp is not None:
+            try:
+                if time.monotonic() - self._last_used < SMTP_IDLE_TIMEOUT:
+                    self._smtp.noop()
+                    return self._smtp
+            except smtplib.SMTPException:
+                pass
+            self.close()
+        smtp = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        if self.starttls:
+            smtp.starttls()
+        if self.username:
+            smtp.login(self.username, self.password or "")
+        self._smtp = smtp
+        return smtp
+
+    def build_email(self, submission):
+        """Turn a submission into an email addressed to the site owner"""
+        email = EmailMessage()
+        email["From"] = self.sender
+        email["To"] = self.recipient
+        email["Reply-To"] = submission.email
+        tag = f"Portfolio/{submission.profile}" if submission.profile else "Portfolio"
+        email["Subject"] = f"[{tag}] {submission.subject}"
+        email.set_content(
+            f"From: {submission.name} <{submission.email}>\n\n{submission.message}\n"
+        )
+        return email
+
+    def send_batch(self, submissions):
+        """Send submissions in order on one connection; return how many went out"""
+        sent = 0
+        try:
+            smtp = self._connection()
+            for submission in submissions:
+                smtp.send_message(self.build_email(submission))
+                sent += 1
+        except (smtplib.SMTPException, OSError) as e:
+            # The rest stay undelivered and are retried on a fresh connection
+            logger.warning("mailed %d of %d contact message(s): %s", sent, len(submissions), e)
+            self.close()
+        else:
+            self._last_used = time.monotonic()
+        return sent
+
+    def close(self):
+        """Close the SMTP connection if open"""
+        if self._smtp is not None:
+            try:
+                self._smtp.quit()
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._smtp = None
+
+
+class ContactPipeline:
+    """Bounded queue -> batched SQLite writer -> optional batched SMTP sender"""
+
+    def __init__(self, db_path=CONTACT_DB, sender=None, queue_size=QUEUE_SIZE,
+                 mail_interval=MAIL_INTERVAL):
+        self.db_path = db_path
+        self.sender = sender
+        self.mail_interval = mail_interval
+        self.failed = 0  # submissions lost to database errors
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._stop = threading.Event()
+        self._mail_wakeup = threading.Event()
+        self._writer = threading.Thread(target=self._write_loop, name="contact-writer", daemon=True)
+        self._mailer = None
+        if sender is not None:
+            self._mailer = threading.Thread(target=self._mail_loop, name="contact-mailer", daemon=True)
+
+    def start(self):
+        """Start the background threads"""
+        self._writer.start()
+        if self._mailer is not None:
+            self._mailer.start()
+        return self
+
+    def submit(self, name, email, subject, message, profile=""):
+        """Queue a submission; return False if the queue is full or the writer has died"""
+        if not self._writer.is_alive():
+            return False
+        try:
+            self._queue.put_nowait(Submission(name, email, subject, message, time.time(), profile))
+        except queue.Full:
+            return False
+        return True
+
+    def _drain(self, first):
+        batch = [first]
+        while len(batch) < WRITE_BATCH:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _write_batch(self, conn, batch):
+        # (Re)open the database on demand, so a failed open is retried next batch
+        if conn is None:
+            conn = connect(self.db_path)
+        with conn:
+            conn.executemany(
+                "INSERT INTO messages (name, email, subject, message, submitted_at, profile) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                batch,
+            )
+        return conn
+
+    def _write_loop(self):
+        conn = None
+        while not (self._stop.is_set() and self._queue.empty()):
+            try:
+                first = self._queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            batch = self._drain(first)
+            try:
+                conn = self._write_batch(conn, batch)
+                self._mail_wakeup.set()
+            except (sqlite3.Error, OSError):
+                # Keep the writer alive; later submissions may still get through
+                self.failed += len(batch)
+                logger.exception("could not store %d contact message(s)", len(batch))
+                if conn is not None:
+                    conn.close()
+                    conn = None
+            finally:
+                # Even a lost batch is done, so flush() never waits on it
+                for _ in batch:
+                    self._queue.task_done()
+        if conn is not None:
+            conn.close()
+
+    def _mail_round(self, conn):
+        try:
+            if conn is None:
+                conn = connect(self.db_path)
+            self.deliver_pending(conn)
+        except (sqlite3.Error, OSError):
+            # e.g. "database is locked" while other workers hold it; the
+            # messages stay stored and are retried next round
+            logger.exception("could not mail pending contact messages")
+            if conn is not None:
+                conn.close()
+                conn = None
+        return conn
+
+    def _mail_loop(self):
+        conn = None
+        while not self._stop.is_set():
+            self._mail_wakeup.wait(self.mail_interval)
+            self._mail_wakeup.clear()
+            conn = self._mail_round(conn)
+        conn = self._mail_round(conn)
+        self.sender.close()
+        if conn is not None:
+            conn.close()
+
+    def claim_batch(self, conn):
+        """Mark up to MAIL_BATCH undelivered messages as being sent by this mailer"""
+        # IMMEDIATE takes the write lock before reading, so two workers sharing
+        # the database (see proxy.py) never claim, and mail, the same rows
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            rows = conn.execute(
+                "SELECT id, name, email, subject, message, submitted_at, profile FROM messages "
+                "WHERE delivered = ? OR (delivered = ? AND claimed_at < ?) ORDER BY id LIMIT ?",
+                (PENDING, SENDING, now - CLAIM_TIMEOUT, MAIL_BATCH),
+            ).fetchall()
+            conn.executemany("UPDATE messages SET delivered = ?, claimed_at = ? WHERE id = ?",
+                             [(SENDING, now, row[0]) for row in rows])
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        return rows
+
+    def deliver_pending(self, conn):
+        """Mail undelivered messages in batches; leave unsent ones queued on failure"""
+        while True:
+            rows = self.claim_batch(conn)
+            if not rows:
+                return
+            ids = [(row[0],) for row in rows]
+            sent = self.sender.send_batch([Submission(*row[1:]) for row in rows])
+            with conn:
+                conn.executemany(f"UPDATE messages SET delivered = {DELIVERED} WHERE id = ?", ids[:sent])
+                # Release the claim on what was not sent; it is retried next round
+                conn.executemany(f"UPDATE messages SET delivered = {PENDING} WHERE id = ?", ids[sent:])
+            if sent < len(rows):
+                return
+
+    def flush(self, timeout=None):
+        """Block until every queued submission has been written"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if deadline is not None and time.monotonic() > deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def stop(self, timeout=5.0):
+        """Write what is queued, then stop the background threads"""
+        self._stop.set()
+        self._mail_wakeup.set()
+        self._writer.join(timeout)
+        if self._mailer is not None:
+            self._mailer.join(timeout)
+
+
+_pipeline = None
+_pipeline_lock = threading.Lock()
+
+
+def get_pipeline():
+    """Return the process-wide contact pipeline, starting it on first use"""
+    global _pipeline
+    if _pipeline is None:
+        with _pipeline_lock:
+            if _pipeline is None:
+                _pipeline = ContactPipeline(sender=SmtpSender.from_env()).start()
+                atexit.register(_pipeline.stop)
+    return _pipeline
+
+
+def submit_contact(name, email, subject, message, profile=""):
+    """Queue a contact form submission; return False if the site is overloaded"""
+    return get_pipeline().submit(name, email, subject, message, profile)
@@ -0,0 +1,233 @@
+"""
+Portfolio Content Store
+Loads the experience, skills, projects and contact data from the files in
+content/. Each file is parsed and validated once and shared by every
+session in the process. A file is reloaded only when its modification time
+or size changes and its bytes hash differently, so editing one file never
+reparses the others. Data derived from several files, such as the
+technology index and the Key Metrics, is rebuilt only when the content
+version changes (or, for durations ending "Present", the month turns).
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import namedtuple
+
+import metrics
+from technologies import TechIndex
+
+CONTENT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "content")
+
+# How often (in seconds) files are re-checked for changes
+CHECK_INTERVAL = float(os.environ.get("PORTFOLIO_CONTENT_CHECK_INTERVAL", "1.0"))
+
+Content = namedtuple(
+    "Content",
+    "profile about_html metric_specs experiences skills proficiency projects aliases "
+    "tech_index key_metrics skill_years version",
+)
+
+
+class ContentError(ValueError):
+    """Raised when a content file is missing fields or has the wrong shape"""
+
+
+def _require(condition, filename, message):
+    if not condition:
+        raise ContentError(f"{filename}: {message}")
+
+
+def _is_str_list(value):
+    return isinstance(value, list) and all(isinstance(item, str) for item in value)
+
+
+def _parse_profile(data, filename):
+    _require(isinstance(data, dict), filename, "expected an object")
+    # Every page and download reads the contact details, so require them here
+    for key in ("name", "initials", "tagline", "page_title", "email",
+                "phone", "location", "linkedin", "github"):
+        _require(isinstance(data.get(key), str), filename, f"missing string field '{key}'")
+    return data
+
+
+def _parse_metric_specs(data, filename):
+    _require(isinstance(data, list), filename, "expected a list")
+    specs = []
+    for i, item in enumerate(data):
+        _require(isinstance(item, dict) and isinstance(item.get("label"), str),
+                 filename, f"entry {i} needs a 'label'")
+        if "value" in item:
+            specs.append({"value": str(item["value"]), "label": item["label"]})
+            continue
+        _require(item.get("metric") in metrics.METRICS, filename,
+                 f"entry {i} needs a 'value' or a 'metric' ({', '.join(metrics.METRICS)})")
+        _require(item["metric"] != "skills_in" or isinstance(item.get("category"), str),
+                 filename, f"entry {i} 'skills_in' needs a 'category'")
+        specs.append(item)
+    return specs
+
+
+def _parse_experiences(data, filename):
+    _require(isinstance(data, list), filename, "expected a list")
+    for i, item in enumerate(data):
+        _require(isinstance(item, dict), filename, f"entry {i} is not an object")
+        for key in ("title", "company", "duration"):
+            _require(isinstance(item.get(key), str), filename, f"entry {i} missing '{key}'")
+        _require(metrics.parse_duration(item["duration"]) is not None, filename,
+                 f"entry {i} 'duration' must look like 'Feb 2021 - Jan 2025' or 'Jan 2025 - Present'")
+        _require(_is_str_list(item.get("description")), filename,
+                 f"entry {i} 'description' must be a list of strings")
+    return data
+
+
+def _parse_skills(data, filename):
+    _require(isinstance(data, dict), filename, "expected an object of category -> skills")
+    for category, skills in data.items():
+        _require(_is_str_list(skills), filename, f"'{category}' must be a list of strings")
+    return data
+
+
+def _parse_proficiency(data, filename):
+    _require(isinstance(data, list) and data, filename, "expected a non-empty list")
+    for i, item in enumerate(data):
+        _require(isinstance(item, dict) and isinstance(item.get("skill"), str)
+                 and isinstance(item.get("proficiency"), (int, float))
+                 and not isinstance(item["proficiency"], bool),
+                 filename, f"entry {i} needs 'skill' and numeric 'proficiency'")
+        # The chart's scale runs from 0 to 100
+        _require(0 <= item["proficiency"] <= 100, filename,
+                 f"entry {i} 'proficiency' must be between 0 and 100")
+    # Column layout, ready for a DataFrame
+    return {
+        'Skill': [item["skill"] for item in data],
+        'Proficiency': [item["proficiency"] for item in data],
+    }
+
+
+def _parse_projects(data, filename):
+    _require(isinstance(data, list), filename, "expected a list")
+    for i, item in enumerate(data):
+        _require(isinstance(item, dict), filename, f"entry {i} is not an object")
+        for key in ("title", "description", "impact"):
+            _require(isinstance(item.get(key), str), filename, f"entry {i} missing '{key}'")
+        _require(_is_str_list(item.get("technologies")), filename,
+                 f"entry {i} 'technologies' must be a list of strings")
+    return data
+
+
+def _parse_aliases(data, filename):
+    _require(isinstance(data, dict), filename, "expected an object of technology -> aliases")
+    for name, aliases in data.items():
+        _require(_is_str_list(aliases), filename, f"'{name}' must be a list of strings")
+    return data
+
+
+def _json(parser):
+    def parse(raw, filename):
+        try:
+            data = json.loads(raw.decode("utf-8"))
+        except ValueError as e:
+            raise ContentError(f"{filename}: invalid JSON ({e})") from e
+        return parser(data, filename)
+    return parse
+
+
+def _text(raw, filename):
+    return raw.decode("utf-8")
+
+
+# Content field -> (file name, parser)
+SOURCES = {
+    "profile": ("profile.json", _json(_parse_profile)),
+    "about_html": ("about.html", _text),
+    "metric_specs": ("key_metrics.json", _json(_parse_metric_specs)),
+    "experiences": ("experiences.json", _json(_parse_experiences)),
+    "skills": ("skills.json", _json(_parse_skills)),
+    "proficiency": ("proficiency.json", _json(_parse_proficiency)),
+    "projects": ("projects.json", _json(_parse_projects)),
+    "aliases": ("aliases.json", _json(_parse_aliases)),
+}
+
+
+class ContentStore:
+    """Process-wide cache of parsed content files with per-file invalidation"""
+
+    def __init__(self, content_dir=CONTENT_DIR, check_interval=CHECK_INTERVAL):
+        self.content_dir = content_dir
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._entries = {}  # field -> (stat key, digest, parsed value)
+        self._snapshot = None
+        self._checked_at = 0.0
+        self._month = None
+
+    def _refresh(self, field):
+        """Reload one field if its file changed; return True when it did"""
+        filename, parser = SOURCES[field]
+        path = os.path.join(self.content_dir, filename)
+        try:
+            st = os.stat(path)
+        except FileNotFoundError as e:
+            raise ContentError(f"{filename}: not found in {self.content_dir}") from e
+        stat_key = (st.st_mtime_ns, st.st_size)
+        entry = self._entries.get(field)
+        if entry and entry[0] == stat_key:
+            return False
+
+        with open(path, "rb") as f:
+            raw = f.read()
+        digest = hashlib.sha256(raw).hexdigest()
+        if entry and entry[1] == digest:
+            # Touched but unchanged: remember the new stat, keep the parsed value
+            self._entries[field] = (stat_key, digest, entry[2])
+            return False
+        self._entries[field] = (stat_key, digest, parser(raw, filename))
+        return True
+
+    def load(self):
+        """Return the current Content, reloading only files that changed"""
+        now = time.monotonic()
+        snapshot = self._snapshot
+        if snapshot is not None and now - self._checked_at < self.check_interval:
+            return snapshot
+
+        with self._lock:
+            if self._snapshot is not None and now - self._checked_at < self.check_interval:
+                return self._snapshot
+            changed = [field for field in SOURCES if self._refresh(field)]
+            month = metrics.current_month()
+            if changed or self._snapshot is None or month != self._month:
+                version = hashlib.sha256(
+                    "".join(self._entries[field][1] for field in SOURCES).encode("ascii")
+                ).hexdigest()[:16]
+                values = {field: self._entries[field][2] for field in SOURCES}
+                tech_index = TechIndex(values["skills"], values["projects"],
+                                       values["experiences"], values["aliases"])
+                derived = {
+                    "tech_index": tech_index,
+                    "key_metrics": metrics.key_metrics(
+                        values["metric_specs"], values["skills"], values["projects"],
+                        values["experiences"], tech_index),
+                    "skill_years": metrics.skill_years(values["experiences"], tech_index),
+                }
+                self._snapshot = Content(version=version, **derived, **values)
+                self._month = month
+            self._checked_at = now
+            return self._snapshot
+
+
+def content_hash(data):
+    """Return a stable sha256 of JSON-serializable content, for cache keys"""
+    encoded = json.dumps(data, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+_store = ContentStore()
+
+
+def load_content():
+    """Return the portfolio content shared by all sessions in this process"""
+    return _store.load()
@@ -0,0 +1,233 @@
+"""
+Résumé and Contact Card Downloads
+Builds a PDF résumé and a vCard from the same content the pages render
+(profile, About text, experiences, skills and projects) for the download
+buttons on the About and Contact pages.
+
+Each artifact is built once per content version: the bytes are kept in a
+bounded in-memory LRU and written to static/downloads/ under a name carrying
+the content hash, so a restart reads them back instead of rebuilding. A
+rerun or a click only hands the cached bytes to the download button.
+"""
+
+import html
+import os
+import re
+import threading
+from collections import OrderedDict, namedtuple
+
+from pdf import PdfDocument
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+DOWNLOAD_DIR = os.path.join(ROOT, "static", "downloads")
+DOWNLOAD_CACHE_SIZE = 64
+
+ACCENT = "#3498db"
+HEADING = "#2c3e50"
+MUTED = "#666666"
+
+# label: button text; build: content -> bytes; file_name: profile -> download name
+Artifact = namedtuple("Artifact", "label build extension mime file_name")
+
+
+def about_paragraphs(about_html):
+    """Plain-text paragraphs of the About section's HTML"""
+    paragraphs = re.findall(r"<p[^>]*>(.*?)</p>", about_html, re.S) or [about_html]
+    texts = (html.unescape(re.sub(r"<[^>]+>", "", p)) for p in paragraphs)
+    return [" ".join(text.split()) for text in texts if text.strip()]
+
+
+def bullet_text(text):
+    """Strip a leading "1." style number from an experience bullet"""
+    return re.sub(r"^\s*\d+[.)]\s*", "", text)
+
+
+def resume_pdf(content):
+    """Typeset the résumé as a PDF"""
+    profile = content.profile
+    doc = PdfDocument(title=f"{profile['name']} - Résumé", author=profile["name"])
+    doc.text(profile["name"], size=22, bold=True, color=ACCENT, leading=1.2)
+    doc.text(profile["tagline"], size=11, color=MUTED)
+    contact = " | ".join(
+        part for part in (profile["email"], profile["phone"], profile["linkedin"], profile["github"])
+        if part
+    )
+    doc.text(contact, size=9, color=MUTED)
+
+    def section(title):
+        doc.space(10)
+        doc.text(title, size=13, bold=True, color=HEADING)
+        doc.rule(ACCENT)
+        doc.space(2)
+
+    section("Summary")
+    for paragraph in about_paragraphs(content.about_html):
+        doc.text(paragraph, size=10)
+        doc.space(3)
+
+    section("Experience")
+    for exp in content.experiences:
+        doc.space(4)
+        doc.text(exp["title"], size=11, bold=True)
+        doc.text(f"{exp['company']} | {exp['duration']}", size=9.5, color=ACCENT)
+        for bullet in exp["description"]:
+            doc.text(bullet_text(bullet), size=9.5, indent=14, bullet="•")
+
+    section("Skills")
+    for category, skills in content.skills.items():
+        doc.text(f"{category}: {', '.join(skills)}", size=9.5)
+
+    section("Projects")
+    for project in content.projects:
+        doc.space(4)
+        doc.text(project["title"], size=11, bold=True)
+        doc.text(project["description"], size=9.5)
+        if project.get("impact"):
+            doc.text(f"Impact: {project['impact']}", size=9.5, color=MUTED)
+        doc.text(", ".join(project["technologies"]), size=9, color=ACCENT)
+    return doc.to_bytes()
+
+
+def vcard_escape(value):
+    """Escape a vCard text value"""
+    return (value.replace("\\", "\\\\").replace("\n", "\\n")
+            .replace(",", "\\,").replace(";", "\\;"))
+
+
+def fold(line):
+    """Fold a content line at 75 octets, as vCard requires"""
+    encoded = line.encode("utf-8")
+    if len(encoded) <= 75:
+        return line
+    parts = []
+    while encoded:
+        limit = 75 if not parts else 74
+        cut = min(limit, len(encoded))
+        # Never split a multi-byte character
+        while cut < len(encoded) and (encoded[cut] & 0xC0) == 0x80:
+            cut -= 1
+        parts.append(encoded[:cut].decode("utf-8"))
+        encoded = encoded[cut:]
+    return "\r\n ".join(parts)
+
+
+def contact_vcard(content):
+    """Build a vCard 3.0 contact card"""
+    profile = content.profile
+    names = profile["name"].split()
+    given, family = " ".join(names[:-1]), names[-1] if names else ""
+    title = profile["tagline"].split("|")[0].strip()
+    lines = [
+        "BEGIN:VCARD",
+        "VERSION:3.0",
+        f"N:{vcard_escape(family)};{vcard_escape(given)};;;",
+        f"FN:{vcard_escape(profile['name'])}",
+        f"TITLE:{vcard_escape(title)}",
+    ]
+    if content.experiences:
+        lines.append(f"ORG:{vcard_escape(content.experiences[0]['company'])}")
+    # The phone field may carry a place after the number ("+91 7208974398, Mumbai, India")
+    lines.append(f"TEL;TYPE=CELL:{vcard_escape(profile['phone'].split(',')[0].strip())}")
+    lines.append(f"EMAIL;TYPE=INTERNET:{vcard_escape(profile['email'])}")
+    lines.append(f"ADR;TYPE=WORK:;;;{vcard_escape(profile['location'])};;;")
+    lines.append(f"URL:{profile['linkedin']}")
+    lines.append(f"URL:{profile['github']}")
+    lines.append("END:VCARD")
+    return ("\r\n".join(fold(line) for line in lines) + "\r\n").encode("utf-8")
+
+
+def _slug(profile):
+    return re.sub(r"[^A-Za-z0-9]+", "-", profile["name"]).strip("-") or "portfolio"
+
+
+ARTIFACTS = {
+    "resume": Artifact("📄 Download Résumé (PDF)", resume_pdf, "pdf", "application/pdf",
+                       lambda profile: f"{_slug(profile)}-Resume.pdf"),
+    "vcard": Artifact("📇 Save Contact (vCard)", contact_vcard, "vcf", "text/vcard",
+                      lambda profile: f"{_slug(profile)}.vcf"),
+}
+
+
+class DownloadCache:
+    """Built artifacts by (kind, content version): memory LRU over files on disk"""
+
+    def __init__(self, out_dir=DOWNLOAD_DIR, max_size=DOWNLOAD_CACHE_SIZE):
+        self.out_dir = out_dir
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._build_lock = threading.Lock()
+        self._artifacts = OrderedDict()  # (kind, version) -> bytes
+
+    def _lookup(self, key):
+        with self._lock:
+            data = self._artifacts.get(key)
+            if data is not None:
+                self._artifacts.move_to_end(key)
+            return data
+
+    def _store(self, key, data):
+        with self._lock:
+            self._artifacts[key] = data
+            self._artifacts.move_to_end(key)
+            while len(self._artifacts) > self.max_size:
+                self._artifacts.popitem(last=False)
+
+    def path(self, kind, version):
+        """File an artifact is kept in on disk"""
+        return os.path.join(self.out_dir, f"{kind}-{version}.{ARTIFACTS[kind].extension}")
+
+    def get(self, kind, content):
+        """Return the artifact's bytes for this content, building it at most once"""
+        key = (kind, content.version)
+        data = self._lookup(key)
+        if data is not None:
+            return data
+
+        # One build per artifact even when many sessions ask at once
+        with self._build_lock:
+            data = self._lookup(key)
+            if data is not None:
+                return data
+            path = self.path(kind, content.version)
+            try:
+                with open(path, "rb") as f:
+                    data = f.read()
+            except OSError:
+                data = ARTIFACTS[kind].build(content)
+                try:
+                    os.makedirs(self.out_dir, exist_ok=True)
+                    tmp = f"{path}.{os.getpid()}.tmp"
+                    with open(tmp, "wb") as f:
+                        f.write(data)
+                    os.replace(tmp, path)
+                except OSError:
+                    # Read-only disk: keep serving from memory
+                    pass
+            self._store(key, data)
+            return data
+
+
+_cache = DownloadCache()
+
+
+def download(kind, content):
+    """Return the cached bytes of an artifact for this content"""
+    return _cache.get(kind, content)
+
+
+def show_downloads(content, kinds=("resume", "vcard"), key="downloads"):
+    """Show download buttons for the given artifacts, side by side"""
+    import streamlit as st
+
+    for column, kind in zip(st.columns(len(kinds)), kinds):
+        artifact = ARTIFACTS[kind]
+        with column:
+            st.download_button(
+                artifact.label,
+                data=download(kind, content),
+                file_name=artifact.file_name(content.profile),
+                mime=artifact.mime,
+                key=f"{key}_{kind}",
+                on_click="ignore",
+                use_container_width=True,
+            )
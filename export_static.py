@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Static Site Exporter
+Renders every page of the portfolio to self-contained HTML so the public
+site can be served without running Python per request. The Streamlit app
+remains available for local preview.
+
+Usage:
+    python export_static.py [--out site]
+"""
+
+import argparse
+import os
+import shutil
+
+from charts import build_chart
+from content import load_content
+from downloads import ARTIFACTS, download
+from images import picture_html, profile_image
+from render import (
+    PAGES, availability_html, contact_intro_html, experience_cards_html,
+    footer_html, header_html, link_label, metrics_grid_html,
+    profile_placeholder_html, project_cards_html, section_header_html,
+    skill_categories_html, style_tag, subheading_html, write_stylesheet,
+)
+
+# Layout rules standing in for Streamlit's columns and navigation buttons
+STATIC_CSS = """
+<style>
+    body { font-family: "Source Sans Pro", sans-serif; color: #2c3e50; max-width: 1200px; margin: 0 auto; padding: 1rem 2rem; }
+    nav { display: grid; grid-template-columns: repeat(5, 1fr); gap: 1rem; border-top: 1px solid #e0e0e0; border-bottom: 1px solid #e0e0e0; padding: 1rem 0; }
+    nav a { text-align: center; padding: 0.5rem; border: 1px solid #e0e0e0; border-radius: 0.5rem; color: #2c3e50; text-decoration: none; }
+    nav a.active { border-color: #3498db; color: #3498db; }
+    .columns { display: grid; grid-template-columns: 2fr 1fr; gap: 2rem; }
+    .columns.even { grid-template-columns: 1fr 1fr; }
+    @media (max-width: 640px) { .columns, .columns.even, nav { grid-template-columns: 1fr; } }
+</style>
+"""
+
+
+def page_filename(page):
+    """Return the output filename for a page key"""
+    return "index.html" if page == "about" else f"{page}.html"
+
+
+def profile_image_html(profile, out_dir):
+    """Copy the profile image variants into out_dir, or fall back to the CSS placeholder"""
+    image = profile_image()
+    if image is None or not image.variants:
+        return profile_placeholder_html(profile)
+    img_dir = os.path.join(out_dir, "img")
+    os.makedirs(img_dir, exist_ok=True)
+    for variant in image.variants:
+        shutil.copy2(variant.path, img_dir)
+    return picture_html(image, profile["name"], url_prefix="img")
+
+
+def download_url(kind, profile):
+    """Site-relative URL of an exported download"""
+    return f"downloads/{ARTIFACTS[kind].file_name(profile)}"
+
+
+def write_downloads(content, out_dir):
+    """Write the résumé and vCard from the download cache; return their paths"""
+    written = []
+    for kind in ARTIFACTS:
+        path = os.path.join(out_dir, download_url(kind, content.profile))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(download(kind, content))
+        written.append(path)
+    return written
+
+
+def downloads_html(content, kinds=("resume", "vcard")):
+    """Download links standing in for the app's download buttons"""
+    links = " ".join(
+        f'<a class="skill-badge" href="{download_url(kind, content.profile)}" download>'
+        f"{ARTIFACTS[kind].label}</a>"
+        for kind in kinds
+    )
+    return f"<p>{links}</p>"
+
+
+def nav_html(active):
+    """Render the navigation bar with the current page highlighted"""
+    links = "".join(
+        f'<a href="{page_filename(page)}" class="{"active" if page == active else ""}">{label}</a>'
+        for page, label in PAGES
+    )
+    return f"<nav>{links}</nav>"
+
+
+def about_body(content):
+    """Render the About page body"""
+    return (
+        section_header_html("About Me")
+        + '<div class="columns">'
+        + f"<div>{content.about_html}{downloads_html(content)}</div>"
+        + f'<div>{subheading_html("Key Metrics")}'
+        + f"{metrics_grid_html(content.key_metrics)}</div>"
+        + "</div>"
+    )
+
+
+def experience_body(content):
+    """Render the Experience page body"""
+    return section_header_html("Professional Experience") + experience_cards_html(content.experiences)
+
+
+def skills_body(content):
+    """Render the Skills page body, with the proficiency chart prerendered as SVG"""
+    return (
+        section_header_html("Technical Skills")
+        + '<div class="columns">'
+        + f"<div>{skill_categories_html(content.skills)}</div>"
+        + f'<div>{subheading_html("Skills Proficiency", level=4)}'
+        + f"{build_chart('proficiency', content.proficiency, backend='svg')}</div>"
+        + "</div>"
+    )
+
+
+def projects_body(content):
+    """Render the Projects page body"""
+    return section_header_html("Featured Projects") + project_cards_html(content.projects)
+
+
+def contact_body(content):
+    """Render the Contact page body; the form becomes a mailto link"""
+    profile = content.profile
+    details = f"""
+    <h3>📍 Contact Information</h3><p>{profile["phone"]}</p>
+    <h3>📧 Email</h3><p><a href="mailto:{profile["email"]}">{profile["email"]}</a></p>
+    <h3>💼 LinkedIn</h3><p><a href="{profile["linkedin"]}">{link_label(profile["linkedin"])}</a></p>
+    <h3>🐙 GitHub</h3><p><a href="{profile["github"]}">{link_label(profile["github"])}</a></p>
+    <h3>📍 Location</h3><p>{profile["location"]}</p>
+    """
+    message = f"""
+    {subheading_html("Send a Message")}
+    <p><a class="skill-badge" href="mailto:{profile["email"]}">Send Message</a></p>
+    """
+    return (
+        section_header_html("Get In Touch")
+        + '<div class="columns even">'
+        + f"<div>{contact_intro_html()}{details}{downloads_html(content)}</div>"
+        + f"<div>{message}</div>"
+        + "</div><hr>"
+        + availability_html()
+    )
+
+
+PAGE_BODIES = {
+    "about": about_body,
+    "experience": experience_body,
+    "skills": skills_body,
+    "projects": projects_body,
+    "contact": contact_body,
+}
+
+
+def render_page(page, content, image_html):
+    """Render one page as a complete HTML document"""
+    profile = content.profile
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{profile["page_title"]}</title>
+{style_tag(url_prefix="css")}
+{STATIC_CSS}
+</head>
+<body>
+{header_html(profile)}
+{image_html}
+{nav_html(page)}
+{PAGE_BODIES[page](content)}
+<hr>
+{footer_html(profile)}
+</body>
+</html>
+"""
+
+
+def export_site(out_dir):
+    """Write every page and download to out_dir and return the written paths"""
+    os.makedirs(out_dir, exist_ok=True)
+    write_stylesheet(os.path.join(out_dir, "css"))
+    content = load_content()
+    image_html = profile_image_html(content.profile, out_dir)
+    written = write_downloads(content, out_dir)
+    for page, _ in PAGES:
+        path = os.path.join(out_dir, page_filename(page))
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(render_page(page, content, image_html))
+        written.append(path)
+    return written
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Export the portfolio as a static site")
+    parser.add_argument("--out", default="site", help="output directory (default: site)")
+    args = parser.parse_args()
+
+    print("📦 Exporting static portfolio...")
+    for path in export_site(args.out):
+        print(f"✅ {path} ({os.path.getsize(path):,} bytes)")
+    print(f"🌐 Serve it with any static file server, e.g. python -m http.server -d {args.out}")
+
+
+if __name__ == "__main__":
+    main()
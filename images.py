@@ -0,0 +1,154 @@
+"""
+Profile Image Pipeline
+Produces right-sized, recompressed variants of the profile photo (200px and
+400px, WebP and JPEG) for a responsive <picture> tag. Variants are written
+under static/img/ with the source file's hash in their names, so they can be
+cached by browsers indefinitely. The current image is remembered in memory
+and the source files are re-checked at most once per content check
+interval, not on every rerun.
+"""
+
+import hashlib
+import os
+import threading
+import time
+from collections import namedtuple
+
+from content import CHECK_INTERVAL
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+STATIC_DIR = os.path.join(ROOT, "static")
+IMAGE_DIR = os.path.join(STATIC_DIR, "img")
+
+# Candidate source images, in order of preference
+PROFILE_SOURCES = ("profile_photo.jpg", "profile_placeholder.jpg")
+
+# Display width is 200px; 400px covers high-density screens
+VARIANT_WIDTHS = (200, 400)
+# (extension, Pillow format, MIME type, save options), preferred format first
+VARIANT_FORMATS = (
+    ("webp", "WEBP", "image/webp", {"quality": 80, "method": 6}),
+    ("jpg", "JPEG", "image/jpeg", {"quality": 82, "optimize": True, "progressive": True}),
+)
+
+Variant = namedtuple("Variant", "width ext mime path")
+ProfileImage = namedtuple("ProfileImage", "source digest variants")
+
+
+def file_digest(path):
+    """Return a short sha256 of a file's bytes"""
+    sha = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(65536), b""):
+            sha.update(chunk)
+    return sha.hexdigest()[:16]
+
+
+def variant_paths(source, digest, out_dir=IMAGE_DIR):
+    """Return the variants of source, whether or not they have been written yet"""
+    stem = os.path.splitext(os.path.basename(source))[0].replace("_", "-")
+    return [
+        Variant(width, ext, mime, os.path.join(out_dir, f"{stem}-{digest}-{width}.{ext}"))
+        for width in VARIANT_WIDTHS
+        for ext, _, mime, _ in VARIANT_FORMATS
+    ]
+
+
+def write_variant(source, variant):
+    """Resize source to one variant's width and write it in the variant's format"""
+    from PIL import Image, ImageOps
+
+    fmt, options = next((fmt, options) for ext, fmt, _, options in VARIANT_FORMATS
+                        if ext == variant.ext)
+    os.makedirs(os.path.dirname(variant.path), exist_ok=True)
+    with Image.open(source) as original:
+        original = ImageOps.exif_transpose(original).convert("RGB")
+        height = round(original.height * variant.width / original.width)
+        resized = original.resize((variant.width, height), Image.LANCZOS)
+    # Write then rename so concurrent readers never see a partial file
+    tmp_path = f"{variant.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    resized.save(tmp_path, fmt, **options)
+    os.replace(tmp_path, variant.path)
+
+
+def build_variants(source, digest, out_dir=IMAGE_DIR):
+    """Write any missing variants of source and return them all"""
+    variants = variant_paths(source, digest, out_dir)
+    for variant in variants:
+        if not os.path.exists(variant.path):
+            write_variant(source, variant)
+    return variants
+
+
+class ProfileImageCache:
+    """Process-wide record of the current profile image and its variants"""
+
+    def __init__(self, root=ROOT, out_dir=IMAGE_DIR, check_interval=CHECK_INTERVAL):
+        self.root = root
+        self.out_dir = out_dir
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._stat_key = None
+        self._image = None
+        self._checked_at = None
+
+    def _probe(self):
+        for name in PROFILE_SOURCES:
+            path = os.path.join(self.root, name)
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                continue
+            return path, (path, st.st_mtime_ns, st.st_size)
+        return None, None
+
+    def get(self):
+        """Return the current ProfileImage, or None when there is no photo"""
+        now = time.monotonic()
+        if self._checked_at is not None and now - self._checked_at < self.check_interval:
+            return self._image
+
+        with self._lock:
+            if self._checked_at is not None and now - self._checked_at < self.check_interval:
+                return self._image
+            source, stat_key = self._probe()
+            if stat_key != self._stat_key:
+                self._image = None
+                if source:
+                    digest = file_digest(source)
+                    try:
+                        variants = build_variants(source, digest, self.out_dir)
+                    except ImportError:
+                        # Without Pillow, serve the original file unchanged
+                        variants = []
+                    self._image = ProfileImage(source, digest, variants)
+                self._stat_key = stat_key
+            self._checked_at = now
+            return self._image
+
+
+_cache = ProfileImageCache()
+
+
+def profile_image():
+    """Return the profile image shared by all sessions in this process"""
+    return _cache.get()
+
+
+def picture_html(image, alt, url_prefix="app/static/img", display_width=VARIANT_WIDTHS[0]):
+    """Render a responsive <picture> tag for the image's variants"""
+    sources = []
+    fallback = None
+    for ext, _, mime, _ in VARIANT_FORMATS:
+        matching = [v for v in image.variants if v.ext == ext]
+        srcset = ", ".join(
+            f"{url_prefix}/{os.path.basename(v.path)} {v.width / display_width:g}x"
+            for v in matching
+        )
+        sources.append(f'<source type="{mime}" srcset="{srcset}">')
+        fallback = f"{url_prefix}/{os.path.basename(matching[0].path)}"
+    return (
+        f'<picture>{"".join(sources)}'
+        f'<img class="profile-image" src="{fallback}" alt="{alt}" '
+        f'width="{display_width}" decoding="async"></picture>'
+    )
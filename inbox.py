@@ -0,0 +1,157 @@
+"""
+Contact Inbox
+The read side of the contact form: the site owner browses, filters and
+searches stored messages on the Inbox page (/inbox), which is not linked
+from the navigation and asks for PORTFOLIO_INBOX_PASSWORD. Without that
+variable the inbox is disabled.
+
+Every query is answered from an index in contact.db and pages with a keyset
+cursor (the last id shown) rather than OFFSET, so each page costs the same
+few rows however deep the visitor pages or however large the inbox grows.
+Ids are assigned in arrival order, so newest-first is id order:
+
+- all messages: the primary key, newest first
+- by sender: the email index
+- by profile: the profile index
+- received since: one seek on the submitted_at index for the first id
+- search: the FTS5 index over subject and message, matched terms ANDed;
+  without FTS5 a LIKE scan is used instead
+
+PORTFOLIO_INBOX_PAGE_SIZE sets the messages per page (default 20).
+"""
+
+import hmac
+import os
+import threading
+import time
+from collections import namedtuple
+
+from contact import CONTACT_DB, connect, has_fts
+
+INBOX_PASSWORD = os.environ.get("PORTFOLIO_INBOX_PASSWORD", "")
+INBOX_PAGE_SIZE = int(os.environ.get("PORTFOLIO_INBOX_PAGE_SIZE", "20"))
+
+InboxMessage = namedtuple("InboxMessage", "id submitted_at name email subject message profile delivered")
+# next_cursor: pass back as cursor for the following page; None on the last page
+InboxPage = namedtuple("InboxPage", "messages next_cursor")
+
+COLUMNS = "m.id, m.submitted_at, m.name, m.email, m.subject, m.message, m.profile, m.delivered"
+
+
+def inbox_enabled():
+    """Whether an inbox password is configured"""
+    return bool(INBOX_PASSWORD)
+
+
+def check_password(password, expected=None):
+    """Compare a password with the inbox password in constant time"""
+    expected = INBOX_PASSWORD if expected is None else expected
+    if not expected:
+        return False
+    return hmac.compare_digest(password.encode("utf-8"), expected.encode("utf-8"))
+
+
+def fts_query(text):
+    """Turn free text into an FTS5 query that matches every word, with no operators"""
+    words = text.split()
+    return " ".join('"' + word.replace('"', '""') + '"' for word in words)
+
+
+class Inbox:
+    """Indexed, keyset-paginated queries over the contact database"""
+
+    def __init__(self, db_path=CONTACT_DB):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = None
+        self._fts = False
+
+    def _connection(self):
+        if self._conn is None:
+            self._conn = connect(self.db_path)
+            self._conn.execute("PRAGMA query_only = ON")
+            self._fts = has_fts(self._conn)
+        return self._conn
+
+    def page(self, cursor=None, search="", sender="", profile=None, since=None,
+             limit=INBOX_PAGE_SIZE):
+        """Return one InboxPage of messages, newest first, older than cursor"""
+        query = fts_query(search)
+        with self._lock:
+            conn = self._connection()
+            source, key = "messages m", "m.id"
+            where = []
+            params = []
+            if query and self._fts and not sender:
+                # Walk the full-text index newest first; it stops after one page
+                source = "messages_fts JOIN messages m ON m.id = messages_fts.rowid"
+                key = "messages_fts.rowid"
+                where.append("messages_fts MATCH ?")
+                params.append(query)
+            elif query and self._fts:
+                # A sender has few messages; probe the full-text index per message
+                where.append("EXISTS (SELECT 1 FROM messages_fts "
+                             "WHERE messages_fts MATCH ? AND messages_fts.rowid = m.id)")
+                params.append(query)
+            elif query:
+                for word in search.split():
+                    where.append("(m.subject LIKE ? OR m.message LIKE ?)")
+                    params.extend([f"%{word}%", f"%{word}%"])
+
+            if cursor is not None:
+                where.append(f"{key} < ?")
+                params.append(cursor)
+            if sender:
+                where.append("m.email = ?")
+                params.append(sender)
+            if profile is not None:
+                where.append("m.profile = ?")
+                params.append(profile)
+            if since is not None:
+                # Ids follow arrival order, so "received since" is an id bound,
+                # found with one seek on the submitted_at index. Filtering on
+                # submitted_at instead would walk the whole key on a sparse range
+                first = conn.execute(
+                    "SELECT id FROM messages WHERE submitted_at >= ? ORDER BY submitted_at LIMIT 1",
+                    (since,),
+                ).fetchone()
+                if first is None:
+                    return InboxPage([], None)
+                where.append(f"{key} >= ?")
+                params.append(first[0])
+
+            sql = (f"SELECT {COLUMNS} FROM {source} "
+                   f"WHERE {' AND '.join(where) or '1'} ORDER BY {key} DESC LIMIT ?")
+            rows = conn.execute(sql, [*params, limit + 1]).fetchall()
+
+        messages = [InboxMessage(*row) for row in rows[:limit]]
+        next_cursor = messages[-1].id if len(rows) > limit else None
+        return InboxPage(messages, next_cursor)
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_inbox = None
+_inbox_lock = threading.Lock()
+
+
+def get_inbox():
+    """Return the process-wide inbox reader"""
+    global _inbox
+    if _inbox is None:
+        with _inbox_lock:
+            if _inbox is None:
+                _inbox = Inbox()
+    return _inbox
+
+
+def since_timestamp(days, now=None):
+    """Unix time `days` ago, or None for no limit"""
+    if not days:
+        return None
+    return (now or time.time()) - days * 86400
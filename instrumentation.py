@@ -0,0 +1,218 @@
+"""
+Render Instrumentation
+Opt-in timing of each stage of a rerun (CSS injection, profile image,
+navigation, each page body, footer) together with the number of elements
+and bytes each stage sends to the browser.
+
+Enable with PORTFOLIO_METRICS=1. Measurements are collected into in-process
+histograms and served in Prometheus text format at
+http://127.0.0.1:9464/metrics (PORTFOLIO_METRICS_PORT changes the port,
+PORTFOLIO_METRICS_HOST the interface, e.g. 0.0.0.0 for Kubernetes probes).
+Set PORTFOLIO_METRICS_LOG=1 to also log one JSON line per stage through the
+"portfolio.metrics" logger. When disabled, stages cost a single attribute
+check.
+
+The same endpoint answers /healthz (the process is up) and /readyz (200
+once warm-up has finished, 503 before; see warmup.py) for load balancers.
+"""
+
+import bisect
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ENABLED = os.environ.get("PORTFOLIO_METRICS") == "1"
+METRICS_HOST = os.environ.get("PORTFOLIO_METRICS_HOST", "127.0.0.1")
+METRICS_PORT = int(os.environ.get("PORTFOLIO_METRICS_PORT", "9464"))
+LOG_STAGES = os.environ.get("PORTFOLIO_METRICS_LOG") == "1"
+
+# Histogram bucket upper bounds, in seconds
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+logger = logging.getLogger("portfolio.metrics")
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus style"""
+
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class Registry:
+    """Thread-safe store of per-stage histograms and counters"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.seconds = {}   # stage -> Histogram
+        self.elements = {}  # stage -> total elements sent
+        self.bytes = {}     # stage -> total bytes sent
+
+    def record(self, stage, seconds, elements, size):
+        with self._lock:
+            self.seconds.setdefault(stage, Histogram()).observe(seconds)
+            self.elements[stage] = self.elements.get(stage, 0) + elements
+            self.bytes[stage] = self.bytes.get(stage, 0) + size
+
+    def render(self):
+        """Return every metric in Prometheus text exposition format"""
+        lines = [
+            "# HELP portfolio_stage_seconds Time spent rendering each stage of a rerun.",
+            "# TYPE portfolio_stage_seconds histogram",
+        ]
+        with self._lock:
+            for stage, hist in sorted(self.seconds.items()):
+                cumulative = 0
+                for bound, count in zip(self.buckets_labels(hist), hist.counts):
+                    cumulative += count
+                    lines.append(f'portfolio_stage_seconds_bucket{{stage="{stage}",le="{bound}"}} {cumulative}')
+                lines.append(f'portfolio_stage_seconds_sum{{stage="{stage}"}} {hist.sum:.6f}')
+                lines.append(f'portfolio_stage_seconds_count{{stage="{stage}"}} {hist.count}')
+            for name, help_text, values in (
+                ("portfolio_stage_elements_total", "Elements sent to the browser by each stage.", self.elements),
+                ("portfolio_stage_bytes_total", "Serialized bytes sent to the browser by each stage.", self.bytes),
+            ):
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} counter")
+                for stage, value in sorted(values.items()):
+                    lines.append(f'{name}{{stage="{stage}"}} {value}')
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def buckets_labels(hist):
+        return [f"{bound:g}" for bound in hist.buckets] + ["+Inf"]
+
+
+registry = Registry()
+
+
+def _always_ready():
+    return True, {}
+
+
+# Returns (ready, details); replaced by warmup.py when a warm-up runs
+_readiness_check = _always_ready
+
+
+def set_readiness_check(check):
+    """Make /readyz report check(), a callable returning (ready, details dict)"""
+    global _readiness_check
+    _readiness_check = check
+
+
+@contextmanager
+def _measure(name):
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    ctx = get_script_run_ctx()
+    sent = {"elements": 0, "bytes": 0}
+    original = None
+    if ctx is not None:
+        original = ctx._enqueue
+
+        def counting_enqueue(msg):
+            if msg.WhichOneof("type") == "delta":
+                sent["elements"] += 1
+            sent["bytes"] += msg.ByteSize()
+            original(msg)
+
+        ctx._enqueue = counting_enqueue
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        if original is not None:
+            ctx._enqueue = original
+        registry.record(name, elapsed, sent["elements"], sent["bytes"])
+        if LOG_STAGES:
+            logger.info(json.dumps({
+                "event": "stage", "stage": name, "seconds": round(elapsed, 6),
+                "elements": sent["elements"], "bytes": sent["bytes"],
+            }))
+
+
+@contextmanager
+def _noop():
+    yield
+
+
+def stage(name):
+    """Context manager timing one stage of a rerun, when metrics are enabled"""
+    if not ENABLED:
+        return _noop()
+    start_metrics_server()
+    return _measure(name)
+
+
+def timed(name):
+    """Decorator form of stage(), for fragments that rerun on their own"""
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with stage(name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path == "/metrics":
+            self._send(200, registry.render(), "text/plain; version=0.0.4; charset=utf-8")
+        elif self.path == "/healthz":
+            self._send(200, "ok\n", "text/plain; charset=utf-8")
+        elif self.path == "/readyz":
+            ready, details = _readiness_check()
+            body = json.dumps(dict(details, ready=ready), indent=2) + "\n"
+            self._send(200 if ready else 503, body, "application/json")
+        else:
+            self.send_error(404)
+
+    def _send(self, status, text, content_type):
+        body = text.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+_server = None
+_server_lock = threading.Lock()
+
+
+def start_metrics_server(host=METRICS_HOST, port=METRICS_PORT):
+    """Serve /metrics, /healthz and /readyz from a background thread; safe to call repeatedly"""
+    global _server
+    if _server is not None:
+        return _server
+    with _server_lock:
+        if _server is None:
+            try:
+                _server = ThreadingHTTPServer((host, port), _MetricsHandler)
+            except OSError as e:
+                # Another process (e.g. a second worker) already owns the port
+                logger.warning("metrics endpoint not started on %s:%s: %s", host, port, e)
+                _server = False
+                return _server
+            _server.daemon_threads = True
+            threading.Thread(target=_server.serve_forever, name="metrics-server",
+                             daemon=True).start()
+    return _server
@@ -0,0 +1,141 @@
+"""
+Derived Portfolio Metrics
+Computes the About page's Key Metrics and each skill's years of use from
+the content itself rather than hand-written numbers. Experience durations
+("Feb 2021 - Jan 2025", "2025 Jan - Present") become month intervals, and
+overlapping roles are merged with NumPy interval arithmetic, so the cost
+stays flat for long histories. Metrics are derived once per content
+version, alongside the technology index.
+
+key_metrics.json lists the cards to show. Each entry is either a literal
+{"value", "label"} or {"metric", "label"} with one of:
+
+- years_experience: whole years covered by experiences, overlaps merged
+- projects: number of projects
+- technologies: distinct technologies across skills and projects
+- skills_in: number of skills in the entry's "category"
+"""
+
+import datetime
+import re
+
+import numpy as np
+
+MONTHS = {name: i for i, name in enumerate(
+    ("jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"))}
+MONTH_YEAR = re.compile(r"^(?:([A-Za-z]{3})[a-z]*\.?\s+(\d{4})|(\d{4})\s+([A-Za-z]{3})[a-z]*\.?)$")
+ONGOING = {"present", "current", "now"}
+
+METRICS = ("years_experience", "projects", "technologies", "skills_in")
+
+
+def month_index(year, month):
+    """Months since year 0, so intervals are plain integers"""
+    return year * 12 + month
+
+
+def current_month(today=None):
+    """Month index of today"""
+    today = today or datetime.date.today()
+    return month_index(today.year, today.month - 1)
+
+
+def parse_month(text, today=None):
+    """Parse "Feb 2021", "2025 Jan" or "Present" to a month index, or None"""
+    text = text.strip()
+    if text.lower() in ONGOING:
+        return current_month(today)
+    match = MONTH_YEAR.match(text)
+    if not match:
+        return None
+    month = (match.group(1) or match.group(4)).lower()
+    year = match.group(2) or match.group(3)
+    if month not in MONTHS:
+        return None
+    return month_index(int(year), MONTHS[month])
+
+
+def parse_duration(duration, today=None):
+    """Parse "start - end" to a half-open (start, end) month interval, or None"""
+    parts = re.split(r"\s+[-–—]\s+", duration.strip())
+    if len(parts) != 2:
+        return None
+    start, end = (parse_month(part, today) for part in parts)
+    if start is None or end is None or end < start:
+        return None
+    # The end month is worked in full
+    return start, end + 1
+
+
+def merged_months(group_ids, starts, ends, groups):
+    """Months covered by each group's intervals, overlaps counted once"""
+    if len(starts) == 0:
+        return np.zeros(groups, dtype=np.int64)
+    group_ids = np.asarray(group_ids, dtype=np.int64)
+    # Shift each group onto its own stretch of the number line, so one
+    # running maximum merges intervals within a group but never across groups
+    span = int(max(np.max(ends), 1)) + 1
+    starts = np.asarray(starts, dtype=np.int64) + group_ids * span
+    ends = np.asarray(ends, dtype=np.int64) + group_ids * span
+    order = np.argsort(starts, kind="stable")
+    starts, ends, group_ids = starts[order], ends[order], group_ids[order]
+
+    reach = np.maximum.accumulate(ends)
+    new_run = np.empty(len(starts), dtype=bool)
+    new_run[0] = True
+    new_run[1:] = starts[1:] > reach[:-1]
+    run_starts = np.flatnonzero(new_run)
+    run_lengths = np.maximum.reduceat(ends, run_starts) - starts[run_starts]
+    return np.bincount(group_ids[run_starts], weights=run_lengths, minlength=groups).astype(np.int64)
+
+
+def experience_intervals(experiences, today=None):
+    """Start and end month arrays for every experience"""
+    intervals = [parse_duration(exp["duration"], today) for exp in experiences]
+    starts = np.array([start for start, _ in intervals], dtype=np.int64)
+    ends = np.array([end for _, end in intervals], dtype=np.int64)
+    return starts, ends
+
+
+def skill_years(experiences, tech_index, today=None):
+    """Years each technology was used, from the roles whose bullets mention it"""
+    starts, ends = experience_intervals(experiences, today)
+    ids = {}    # technology -> id
+    pairs = []  # (technology id, experience index)
+    for i, exp in enumerate(experiences):
+        for bullet in exp["description"]:
+            for name in tech_index.mentions(bullet):
+                pairs.append((ids.setdefault(name, len(ids)), i))
+    if not pairs:
+        return {}
+    tech_ids, rows = np.array(pairs, dtype=np.int64).T
+    months = merged_months(tech_ids, starts[rows], ends[rows], len(ids))
+    return {name: round(float(months[i]) / 12, 1) for name, i in ids.items()}
+
+
+def compute_metric(spec, skills, projects, experiences, tech_index, today=None):
+    """Return the display value of one metric"""
+    metric = spec["metric"]
+    if metric == "years_experience":
+        starts, ends = experience_intervals(experiences, today)
+        months = merged_months(np.zeros(len(starts)), starts, ends, 1)[0]
+        return f"{months // 12}+"
+    if metric == "projects":
+        return str(len(projects))
+    if metric == "technologies":
+        names = {tech_index.canonical(name) for names in skills.values() for name in names}
+        names.update(tech_index.canonical(name) for p in projects for name in p["technologies"])
+        return str(len(names))
+    if metric == "skills_in":
+        return str(len(skills.get(spec["category"], [])))
+    raise ValueError(f"unknown metric '{metric}'")
+
+
+def key_metrics(specs, skills, projects, experiences, tech_index, today=None):
+    """Return the Key Metrics cards as (value, label) pairs"""
+    return [
+        (spec["value"] if "value" in spec
+         else compute_metric(spec, skills, projects, experiences, tech_index, today),
+         spec["label"])
+        for spec in specs
+    ]
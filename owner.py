@@ -0,0 +1,39 @@
+"""
+Owner Pages
+Sign-in shared by the owner-only pages, Inbox (/inbox) and Analytics
+(/analytics). Neither is linked from the navigation; both exist only when
+PORTFOLIO_INBOX_PASSWORD is set, and one sign-in per session opens both.
+"""
+
+import streamlit as st
+
+from inbox import check_password, inbox_enabled
+
+# Hidden pages as (key, title), registered only when owner_enabled()
+OWNER_PAGES = [
+    ("inbox", "Inbox"),
+    ("analytics", "Analytics"),
+]
+
+
+def owner_enabled():
+    """Whether the owner pages are enabled"""
+    return inbox_enabled()
+
+
+def _sign_in():
+    st.session_state.owner_signed_in = check_password(st.session_state.get("owner_password", ""))
+    st.session_state.owner_password = ""
+    st.session_state.owner_failed = not st.session_state.owner_signed_in
+
+
+def require_owner():
+    """Return True when this session is signed in; otherwise show the sign-in form"""
+    if st.session_state.get("owner_signed_in"):
+        return True
+    with st.form("owner_sign_in"):
+        st.text_input("Password", type="password", key="owner_password")
+        st.form_submit_button("Sign in", on_click=_sign_in)
+    if st.session_state.get("owner_failed"):
+        st.error("Wrong password.")
+    return False
@@ -0,0 +1,55 @@
+"""
+Card List Pagination
+"Load more" paging for the Experience and Projects lists. A visit renders
+only the first page of cards, and each "Load more" click reveals the next
+page from the per-item HTML cache in render.py, so the cost of a rerun
+follows the number of visible cards rather than the size of the catalog.
+
+Set PORTFOLIO_PAGE_SIZE to change how many cards are shown at first
+(default 10). Visitors can pick another page size when a list is long.
+"""
+
+import os
+
+import streamlit as st
+
+PAGE_SIZE = int(os.environ.get("PORTFOLIO_PAGE_SIZE", "10"))
+PAGE_SIZES = sorted({5, 10, 25, 50, PAGE_SIZE})
+
+
+def _show_more(shown_key, step):
+    st.session_state[shown_key] += step
+
+
+def _reset(shown_key, size_key):
+    st.session_state[shown_key] = st.session_state[size_key]
+
+
+def paginated_cards(key, items, cards_html):
+    """Render the visible page of items with cards_html, then the paging controls"""
+    size_key, shown_key = f"{key}_page_size", f"{key}_shown"
+    page_size = st.session_state.get(size_key, PAGE_SIZE)
+    # Callbacks update the count before the rerun, so a click costs one run
+    shown = min(st.session_state.setdefault(shown_key, page_size), len(items))
+    st.markdown(cards_html(items[:shown]), unsafe_allow_html=True)
+
+    if len(items) <= PAGE_SIZES[0]:
+        return
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        st.caption(f"Showing {shown} of {len(items)}")
+        if shown < len(items):
+            st.button(
+                f"Load {min(page_size, len(items) - shown)} more",
+                key=f"{key}_more",
+                on_click=_show_more,
+                args=(shown_key, page_size),
+            )
+    with col2:
+        st.selectbox(
+            "Per page", PAGE_SIZES,
+            index=PAGE_SIZES.index(PAGE_SIZE),
+            key=size_key,
+            on_change=_reset,
+            args=(shown_key, size_key),
+        )
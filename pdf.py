@@ -0,0 +1,163 @@
+"""
+Minimal PDF Writer
+Just enough PDF to typeset a résumé without a third-party dependency:
+A4 pages of left-aligned text in the standard Helvetica and Helvetica-Bold
+fonts (WinAnsi encoding, so no fonts are embedded), word-wrapped to the
+text width, with page breaks, colour and horizontal rules. Content streams
+are Flate-compressed. Output is deterministic: the same calls produce the
+same bytes, so it can be cached by content hash.
+"""
+
+import zlib
+
+PAGE_WIDTH, PAGE_HEIGHT = 595, 842  # A4 in points
+MARGIN = 50
+
+FONTS = {False: ("F1", "Helvetica"), True: ("F2", "Helvetica-Bold")}
+
+# Advance widths (1/1000 em) of characters 32-126, from the standard AFM metrics
+_HELVETICA = (
+    278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556,
+    1015, 667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 278, 278, 278, 469, 556,
+    333, 556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556,
+    556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584,
+)
+_HELVETICA_BOLD = (
+    278, 333, 474, 556, 556, 889, 722, 238, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 333, 333, 584, 584, 584, 611,
+    975, 722, 722, 722, 722, 667, 611, 778, 722, 278, 556, 722, 611, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 333, 278, 333, 584, 556,
+    333, 556, 611, 556, 611, 556, 333, 611, 611, 278, 278, 556, 278, 889, 611, 611,
+    611, 611, 389, 556, 333, 611, 556, 778, 556, 556, 500, 389, 280, 389, 584,
+)
+WIDTHS = {False: _HELVETICA, True: _HELVETICA_BOLD}
+DEFAULT_WIDTH = 556  # accented letters, dashes and other WinAnsi characters
+
+
+def text_width(text, size, bold=False):
+    """Width of a line of text in points"""
+    widths = WIDTHS[bold]
+    return size / 1000 * sum(
+        widths[ord(c) - 32] if 32 <= ord(c) <= 126 else DEFAULT_WIDTH for c in text
+    )
+
+
+def wrap(text, size, width, bold=False):
+    """Split text into lines no wider than width, breaking at spaces"""
+    lines = []
+    line = ""
+    for word in text.split():
+        candidate = f"{line} {word}" if line else word
+        if line and text_width(candidate, size, bold) > width:
+            lines.append(line)
+            line = word
+        else:
+            line = candidate
+    if line:
+        lines.append(line)
+    return lines
+
+
+def pdf_string(text):
+    """Encode text as a PDF literal string in WinAnsi"""
+    raw = text.encode("cp1252", errors="replace")
+    return b"(" + raw.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)") + b")"
+
+
+def hex_color(color):
+    """PDF colour operands for a #rrggbb colour"""
+    return " ".join(f"{int(color[i:i + 2], 16) / 255:.3f}" for i in (1, 3, 5))
+
+
+class PdfDocument:
+    """Flowing text laid out top to bottom across as many A4 pages as needed"""
+
+    def __init__(self, title="", author=""):
+        self.title = title
+        self.author = author
+        self.pages = []  # finished content streams
+        self._ops = []
+        self.y = PAGE_HEIGHT - MARGIN
+
+    @property
+    def line_width(self):
+        return PAGE_WIDTH - 2 * MARGIN
+
+    def _new_page(self):
+        self.pages.append(b"\n".join(self._ops))
+        self._ops = []
+        self.y = PAGE_HEIGHT - MARGIN
+
+    def _ensure(self, height):
+        if self.y - height < MARGIN and self._ops:
+            self._new_page()
+
+    def text(self, text, size=10, bold=False, indent=0, color="#000000", bullet=None, leading=1.35):
+        """Write a wrapped paragraph; bullet hangs in the indent before the first line"""
+        line_height = size * leading
+        font, _ = FONTS[bold]
+        lines = wrap(text, size, self.line_width - indent, bold) or [""]
+        for i, line in enumerate(lines):
+            self._ensure(line_height)
+            self.y -= line_height
+            x = MARGIN + indent
+            ops = [b"BT", f"{hex_color(color)} rg /{font} {size} Tf".encode("ascii")]
+            if bullet and i == 0:
+                ops.append(f"1 0 0 1 {x - size:.2f} {self.y:.2f} Tm".encode("ascii"))
+                ops.append(pdf_string(bullet) + b" Tj")
+            ops.append(f"1 0 0 1 {x:.2f} {self.y:.2f} Tm".encode("ascii"))
+            ops.append(pdf_string(line) + b" Tj")
+            ops.append(b"ET")
+            self._ops.append(b" ".join(ops))
+
+    def space(self, points):
+        """Leave vertical space"""
+        self.y -= points
+
+    def rule(self, color="#3498db", width=1.0):
+        """Draw a horizontal line across the text width"""
+        self._ensure(width + 4)
+        self.y -= 4
+        self._ops.append(
+            f"{hex_color(color)} RG {width} w {MARGIN} {self.y:.2f} m "
+            f"{PAGE_WIDTH - MARGIN} {self.y:.2f} l S".encode("ascii")
+        )
+
+    def to_bytes(self):
+        """Serialize the document"""
+        pages = self.pages + ([b"\n".join(self._ops)] if self._ops or not self.pages else [])
+        objects = [
+            b"<< /Type /Catalog /Pages 2 0 R >>",
+            None,  # page tree, filled in once the page objects are numbered
+            b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+            b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica-Bold /Encoding /WinAnsiEncoding >>",
+            b"<< /Title " + pdf_string(self.title) + b" /Author " + pdf_string(self.author)
+            + b" /Producer (portfolio) >>",
+        ]
+        page_ids = []
+        for stream in pages:
+            data = zlib.compress(stream, 9)
+            objects.append(b"<< /Length %d /Filter /FlateDecode >>\nstream\n" % len(data)
+                           + data + b"\nendstream")
+            content_id = len(objects)
+            objects.append(
+                b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %d %d] " % (PAGE_WIDTH, PAGE_HEIGHT)
+                + b"/Resources << /Font << /F1 3 0 R /F2 4 0 R >> >> /Contents %d 0 R >>" % content_id
+            )
+            page_ids.append(len(objects))
+        kids = b" ".join(b"%d 0 R" % i for i in page_ids)
+        objects[1] = b"<< /Type /Pages /Kids [" + kids + b"] /Count %d >>" % len(page_ids)
+
+        out = bytearray(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+        offsets = []
+        for number, body in enumerate(objects, start=1):
+            offsets.append(len(out))
+            out += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+        xref = len(out)
+        out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+        out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+        out += (b"trailer\n<< /Size %d /Root 1 0 R /Info 5 0 R >>\nstartxref\n%d\n%%%%EOF\n"
+                % (len(objects) + 1, xref))
+        return bytes(out)
@@ -2,42 +2,17 @@
 Profile Image Placeholder Generator
 This script creates a placeholder profile image for the portfolio.
 Replace this with your actual profile photo.
+
+The placeholder is built by build_assets.py together with the resized
+variants the app serves, so this is a shortcut for `python build_assets.py`.
 """
 
-from PIL import Image, ImageDraw, ImageFont
-import os
+from build_assets import build_assets
 
 def create_profile_placeholder():
-    """Create a placeholder profile image with initials"""
-    
-    # Create a 400x400 image with blue background
-    size = (400, 400)
-    img = Image.new('RGB', size, color='#3498db')
-    draw = ImageDraw.Draw(img)
-    
-    # Try to use a system font, fallback to default if not available
-    try:
-        font = ImageFont.truetype("arial.ttf", 120)
-    except:
-        try:
-            font = ImageFont.truetype("/System/Library/Fonts/Arial.ttf", 120)
-        except:
-            font = ImageFont.load_default()
-    
-    # Draw initials "AS" in white
-    text = "AS"
-    bbox = draw.textbbox((0, 0), text, font=font)
-    text_width = bbox[2] - bbox[0]
-    text_height = bbox[3] - bbox[1]
-    
-    x = (size[0] - text_width) // 2
-    y = (size[1] - text_height) // 2
-    
-    draw.text((x, y), text, fill='white', font=font)
-    
-    # Save the image
-    img.save('profile_phot0.JPG.jpg', 'JPEG')
-    print("Profile placeholder image created: profile_phot0.jpg")
+    """Create a placeholder profile image with initials, if it is out of date"""
+    for name, status in build_assets():
+        print(f"{name}: {status}")
 
 if __name__ == "__main__":
     create_profile_placeholder()
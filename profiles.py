@@ -0,0 +1,99 @@
+"""
+Multi-Profile Hosting
+Serves many portfolios from one process. Each profile is a directory under
+profiles/ (PORTFOLIO_PROFILES_DIR) with the same files as content/ and,
+optionally, its own profile_photo.jpg. A profile is selected with
+?profile=<name> and remembered for the rest of the session.
+
+Code, the stylesheet and image variants are shared by every profile. Each
+profile's content store and image cache live in a bounded LRU
+(PORTFOLIO_PROFILE_CACHE_SIZE, default 128 profiles), so memory stays flat
+however many profiles exist on disk; an evicted profile is simply reloaded
+from its files on its next visit. Without ?profile= the app serves content/.
+"""
+
+import os
+import re
+import threading
+from collections import OrderedDict, namedtuple
+
+import streamlit as st
+
+from content import ContentError, ContentStore, load_content
+from images import ProfileImageCache, profile_image
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+PROFILES_DIR = os.environ.get("PORTFOLIO_PROFILES_DIR", os.path.join(ROOT, "profiles"))
+PROFILE_CACHE_SIZE = int(os.environ.get("PORTFOLIO_PROFILE_CACHE_SIZE", "128"))
+
+# Profile names double as directory names, so keep them to a safe alphabet
+PROFILE_NAME = re.compile(r"[a-z0-9][a-z0-9_-]{0,63}")
+
+Tenant = namedtuple("Tenant", "name store images")
+
+
+class ProfileNotFound(ContentError):
+    """Raised when a requested profile has no directory under PROFILES_DIR"""
+
+
+class TenantCache:
+    """Bounded LRU of per-profile content stores and image caches"""
+
+    def __init__(self, profiles_dir=PROFILES_DIR, max_size=PROFILE_CACHE_SIZE):
+        self.profiles_dir = profiles_dir
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._tenants = OrderedDict()  # name -> Tenant
+
+    def get(self, name):
+        """Return the Tenant for a profile name, loading it on first use"""
+        with self._lock:
+            tenant = self._tenants.get(name)
+            if tenant is not None:
+                self._tenants.move_to_end(name)
+                return tenant
+
+        directory = os.path.join(self.profiles_dir, name)
+        if not PROFILE_NAME.fullmatch(name) or not os.path.isdir(directory):
+            raise ProfileNotFound(f"no profile named '{name}'")
+        tenant = Tenant(name, ContentStore(directory), ProfileImageCache(root=directory))
+
+        with self._lock:
+            tenant = self._tenants.setdefault(name, tenant)
+            self._tenants.move_to_end(name)
+            while len(self._tenants) > self.max_size:
+                self._tenants.popitem(last=False)
+        return tenant
+
+    def __len__(self):
+        return len(self._tenants)
+
+
+_tenants = TenantCache()
+
+
+def profile_content(name=""):
+    """Return a profile's Content, or the default content/ for an empty name"""
+    if not name:
+        return load_content()
+    return _tenants.get(name).store.load()
+
+
+def profile_photo(name=""):
+    """Return a profile's ProfileImage, or None when it has no photo"""
+    if not name:
+        return profile_image()
+    return _tenants.get(name).images.get()
+
+
+def current_profile():
+    """Return the profile selected by ?profile= in this session, or "" for the default"""
+    name = st.query_params.get("profile")
+    if name is not None:
+        st.session_state.profile = name
+    return st.session_state.get("profile", "")
+
+
+def current_content():
+    """Return the Content of the profile this session is viewing"""
+    return profile_content(current_profile())
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Sticky-Session Worker Proxy
+Runs N copies of the app (each through warmup.py, on its own port) behind
+one asyncio reverse proxy, so the portfolio can use every core of a box.
+
+A Streamlit session lives in the memory of one worker, so the proxy pins
+each browser to a worker with a cookie set on its first response; the
+page, its assets and its websocket all reach the same process. A client
+connection is bound to one worker for its whole life and bytes are piped
+in both directions, which carries websocket upgrades through unchanged.
+
+Each worker's /readyz (see warmup.py) is polled every few seconds. Workers
+that are still warming or fail the check receive no new visitors, and
+workers whose process exits are restarted with backoff. A visitor pinned to
+a dead worker is moved to a healthy one and starts a fresh session.
+
+Usage:
+    python proxy.py [--workers 4] [--port 8501] [--worker-port 8511]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import re
+import signal
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+COOKIE = "portfolio_worker"
+COOKIE_PATTERN = re.compile(rf"(?:^|;\s*){COOKIE}=(\d+)")
+
+HEALTH_INTERVAL = 2.0
+HEALTH_TIMEOUT = 2.0
+RESTART_BACKOFF = (1, 2, 5, 10, 30)
+MAX_HEAD_BYTES = 65536
+PIPE_CHUNK = 65536
+
+logger = logging.getLogger("portfolio.proxy")
+
+
+class Worker:
+    """One app process and its health"""
+
+    def __init__(self, index, port, metrics_port):
+        self.index = index
+        self.port = port
+        self.metrics_port = metrics_port
+        self.process = None
+        self.healthy = False
+        self.connections = 0
+        self.restarts = 0
+        self._next_start = 0.0
+
+    async def start(self):
+        """Launch the worker through warmup.py"""
+        env = dict(os.environ, PORTFOLIO_METRICS_PORT=str(self.metrics_port))
+        self.process = await asyncio.create_subprocess_exec(
+            sys.executable, os.path.join(ROOT, "warmup.py"),
+            f"--server.port={self.port}", "--server.address=127.0.0.1",
+            "--server.headless=true", "--browser.gatherUsageStats=false",
+            cwd=ROOT, env=env,
+            stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.DEVNULL,
+        )
+        self.healthy = False
+        logger.info("worker %d started on port %d (pid %d)", self.index, self.port, self.process.pid)
+
+    @property
+    def alive(self):
+        return self.process is not None and self.process.returncode is None
+
+    async def check(self):
+        """Restart the worker if it exited, then poll its readiness endpoint"""
+        if not self.alive:
+            self.healthy = False
+            if time.monotonic() >= self._next_start:
+                backoff = RESTART_BACKOFF[min(self.restarts, len(RESTART_BACKOFF) - 1)]
+                self._next_start = time.monotonic() + backoff
+                if self.process is not None:
+                    self.restarts += 1
+                    logger.warning("worker %d exited with %s; restarting",
+                                   self.index, self.process.returncode)
+                await self.start()
+            return
+        self.healthy = await http_ok("127.0.0.1", self.metrics_port, "/readyz")
+        if self.healthy:
+            self.restarts = 0
+
+    async def stop(self):
+        """Terminate the worker process"""
+        if self.alive:
+            self.process.terminate()
+            try:
+                await asyncio.wait_for(self.process.wait(), 10)
+            except asyncio.TimeoutError:
+                self.process.kill()
+
+
+async def http_ok(host, port, path):
+    """Whether GET path answers 200 within HEALTH_TIMEOUT"""
+    try:
+        reader, writer = await asyncio.wait_for(asyncio.open_connection(host, port), HEALTH_TIMEOUT)
+    except (OSError, asyncio.TimeoutError):
+        return False
+    try:
+        writer.write(f"GET {path} HTTP/1.1\r\nHost: {host}\r\nConnection: close\r\n\r\n".encode("ascii"))
+        await writer.drain()
+        status_line = await asyncio.wait_for(reader.readline(), HEALTH_TIMEOUT)
+        return status_line.split(b" ")[1:2] == [b"200"]
+    except (OSError, asyncio.TimeoutError):
+        return False
+    finally:
+        writer.close()
+
+
+async def pipe(reader, writer):
+    """Copy bytes from reader to writer until EOF"""
+    try:
+        while True:
+            data = await reader.read(PIPE_CHUNK)
+            if not data:
+                break
+            writer.write(data)
+            await writer.drain()
+    except (OSError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        try:
+            writer.write_eof()
+        except (OSError, RuntimeError):
+            pass
+
+
+class StickyProxy:
+    """Reverse proxy pinning each browser to one worker by cookie"""
+
+    def __init__(self, workers):
+        self.workers = workers
+
+    def choose(self, head):
+        """Return (worker, pinned) for a request head"""
+        cookies = re.search(rb"(?im)^cookie:(.*)$", head)
+        if cookies:
+            match = COOKIE_PATTERN.search(cookies.group(1).decode("latin-1").strip())
+            if match:
+                index = int(match.group(1))
+                if index < len(self.workers) and self.workers[index].healthy:
+                    return self.workers[index], True
+        healthy = [w for w in self.workers if w.healthy]
+        if not healthy:
+            return None, False
+        return min(healthy, key=lambda w: w.connections), False
+
+    async def handle(self, client_reader, client_writer):
+        """Route one client connection to a worker and relay it"""
+        try:
+            head = await client_reader.readuntil(b"\r\n\r\n")
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+            client_writer.close()
+            return
+
+        upstream = None
+        while upstream is None:
+            worker, pinned = self.choose(head)
+            if worker is None:
+                break
+            try:
+                upstream = await asyncio.open_connection("127.0.0.1", worker.port)
+            except OSError:
+                # Died since the last health check; try another worker
+                worker.healthy = False
+
+        if upstream is None:
+            body = b"No worker is ready yet; retry shortly.\n"
+            client_writer.write(
+                b"HTTP/1.1 503 Service Unavailable\r\nRetry-After: 2\r\nConnection: close\r\n"
+                b"Content-Type: text/plain\r\nContent-Length: " + str(len(body)).encode() + b"\r\n\r\n" + body
+            )
+            await client_writer.drain()
+            client_writer.close()
+            return
+
+        upstream_reader, upstream_writer = upstream
+        worker.connections += 1
+        try:
+            upstream_writer.write(head)
+            await upstream_writer.drain()
+            if not pinned:
+                # Pin the browser to this worker from its first response on
+                response_head = await upstream_reader.readuntil(b"\r\n\r\n")
+                cookie = f"Set-Cookie: {COOKIE}={worker.index}; Path=/; HttpOnly; SameSite=Lax\r\n"
+                client_writer.write(response_head[:-2] + cookie.encode("ascii") + b"\r\n")
+            await asyncio.gather(
+                pipe(client_reader, upstream_writer),
+                pipe(upstream_reader, client_writer),
+            )
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+            pass
+        finally:
+            worker.connections -= 1
+            upstream_writer.close()
+            client_writer.close()
+
+    async def health_loop(self):
+        """Check every worker periodically"""
+        while True:
+            await asyncio.gather(*(w.check() for w in self.workers))
+            await asyncio.sleep(HEALTH_INTERVAL)
+
+
+async def serve(args):
+    """Start the workers and the proxy, and run until interrupted"""
+    workers = [Worker(i, args.worker_port + i, args.metrics_port + i) for i in range(args.workers)]
+    proxy = StickyProxy(workers)
+    for worker in workers:
+        await worker.start()
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    server = await asyncio.start_server(proxy.handle, args.host, args.port,
+                                        limit=MAX_HEAD_BYTES, backlog=2048)
+    health = asyncio.create_task(proxy.health_loop())
+    print(f"🚀 Proxy on http://{args.host}:{args.port} -> {args.workers} worker(s) "
+          f"on ports {args.worker_port}-{args.worker_port + args.workers - 1}")
+    print("🛑 Press Ctrl+C to stop")
+    async with server:
+        await stop.wait()
+    health.cancel()
+    await asyncio.gather(*(w.stop() for w in workers))
+    print("\n👋 Workers stopped")
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Run N app workers behind a sticky-session proxy")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=8501, help="public proxy port")
+    parser.add_argument("--worker-port", type=int, default=8511, help="port of the first worker")
+    parser.add_argument("--metrics-port", type=int, default=9465,
+                        help="readiness/metrics port of the first worker")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(name)s: %(message)s")
+    asyncio.run(serve(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,522 @@
+"""
+Portfolio HTML Rendering
+HTML fragments for each portfolio section. The Streamlit app and the static
+site exporter both render from these functions so the two stay identical.
+
+Each experience and project compiles to one complete HTML block, cached per
+item by content hash, so a page goes out as a few large st.markdown deltas
+instead of one per header and bullet.
+
+All styling lives in GLOBAL_CSS, which is written once as a minified
+stylesheet named after its hash (static/css/portfolio-<hash>.css) and
+linked from each page, so reruns send a short <link> tag instead of the
+whole stylesheet and the markup carries classes instead of inline styles.
+Streamlit serves .css from the static folder as text/css only from 1.56 on.
+"""
+
+import hashlib
+import html
+import os
+import time
+import re
+import textwrap
+import threading
+from collections import OrderedDict
+
+from content import content_hash
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+CSS_DIR = os.path.join(ROOT, "static", "css")
+
+# Rendered cards kept in memory, least recently used evicted first
+CARD_CACHE_SIZE = 4096
+
+PAGES = [
+    ("about", "About"),
+    ("experience", "Experience"),
+    ("skills", "Skills"),
+    ("projects", "Projects"),
+    ("contact", "Contact"),
+]
+
+GLOBAL_CSS = """
+    .main-header {
+        font-size: 3rem;
+        font-weight: 700;
+        color: #1f77b4;
+        text-align: center;
+        margin-bottom: 0.5rem;
+    }
+    .sub-header {
+        font-size: 1.5rem;
+        color: #666;
+        text-align: center;
+        margin-bottom: 2rem;
+    }
+    .profile-image {
+        display: block;
+        margin: 0 auto 2rem;
+        max-width: 100%;
+        height: auto;
+    }
+    .section-header {
+        font-size: 2rem;
+        font-weight: 600;
+        color: #2c3e50;
+        border-bottom: 3px solid #3498db;
+        padding-bottom: 0.5rem;
+        margin-top: 2rem;
+        margin-bottom: 1rem;
+    }
+    .experience-card {
+        background-color: #f8f9fa;
+        padding: 1.5rem;
+        border-radius: 10px;
+        border-left: 5px solid #3498db;
+        margin-bottom: 1rem;
+        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+    }
+    .skill-badge {
+        display: inline-block;
+        background-color: #3498db;
+        color: white;
+        padding: 0.5rem 1rem;
+        border-radius: 20px;
+        margin: 0.25rem;
+        font-size: 0.9rem;
+    }
+    .skill-badge:link, .skill-badge:visited {
+        color: white;
+        text-decoration: none;
+    }
+    .skill-badge:hover {
+        background-color: #2c3e50;
+    }
+    .project-card {
+        background-color: #ffffff;
+        padding: 1.5rem;
+        border-radius: 10px;
+        border: 1px solid #e0e0e0;
+        margin-bottom: 1rem;
+        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+    }
+    .contact-info {
+        background-color: #f8f9fa;
+        padding: 1.5rem;
+        border-radius: 10px;
+        text-align: center;
+    }
+    .metric-grid {
+        display: grid;
+        grid-template-columns: 1fr 1fr;
+        gap: 1rem;
+    }
+    .metric-card {
+        background-color: #ffffff;
+        padding: 1rem;
+        border-radius: 10px;
+        border: 1px solid #e0e0e0;
+        text-align: center;
+        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+    }
+    .metric-card h3 {
+        color: #3498db;
+        margin: 0;
+    }
+    .metric-card p {
+        margin: 0;
+    }
+    .subheading {
+        color: #2c3e50;
+    }
+    .profile-placeholder {
+        text-align: center;
+        margin-bottom: 2rem;
+    }
+    .profile-initials {
+        width: 200px;
+        height: 200px;
+        border-radius: 50%;
+        background-color: #3498db;
+        margin: 0 auto;
+        display: flex;
+        align-items: center;
+        justify-content: center;
+        color: white;
+        font-size: 4rem;
+    }
+    .experience-card h3, .project-card h3 {
+        color: #2c3e50;
+        margin-top: 0;
+    }
+    .experience-card h4 {
+        color: #3498db;
+        margin: 0.5rem 0;
+    }
+    .experience-card p {
+        color: #666;
+        font-style: italic;
+        margin: 0.5rem 0;
+    }
+    .experience-card ul {
+        margin: 1rem 0;
+    }
+    .skill-category {
+        color: #2c3e50;
+        margin-top: 1.5rem;
+    }
+    .project-description {
+        font-size: 1.1rem;
+        line-height: 1.6;
+        margin: 1rem 0;
+    }
+    .project-card h4 {
+        color: #3498db;
+        margin: 1rem 0 0.5rem 0;
+    }
+    .project-card h4.impact-heading {
+        color: #27ae60;
+    }
+    .project-impact {
+        font-style: italic;
+        color: #666;
+    }
+    .bar-chart {
+        font-size: 0.9rem;
+    }
+    .bar-row {
+        display: grid;
+        grid-template-columns: 8rem 1fr 2.5rem;
+        align-items: center;
+        gap: 0.5rem;
+        margin: 0.35rem 0;
+    }
+    .bar-label {
+        text-align: right;
+        color: #2c3e50;
+    }
+    .bar-track {
+        background-color: #f8f9fa;
+        border-radius: 4px;
+        height: 1.4rem;
+    }
+    .bar-fill {
+        display: block;
+        height: 100%;
+        border-radius: 4px;
+    }
+    .bar-value {
+        color: #666;
+    }
+    .contact-info h3 {
+        color: #2c3e50;
+    }
+    .contact-info p {
+        font-size: 1.1rem;
+        margin: 1rem 0;
+    }
+    .note {
+        text-align: center;
+        color: #666;
+        margin-top: 2rem;
+    }
+    .inbox-message {
+        background-color: #ffffff;
+        padding: 1rem 1.5rem;
+        border-radius: 10px;
+        border: 1px solid #e0e0e0;
+        margin-bottom: 0.75rem;
+    }
+    .inbox-message h4 {
+        color: #2c3e50;
+        margin: 0;
+    }
+    .inbox-meta {
+        color: #666;
+        font-size: 0.9rem;
+        margin: 0.25rem 0 0.75rem;
+    }
+    .inbox-body {
+        margin: 0;
+    }
+    .views-table {
+        width: 100%;
+        border-collapse: collapse;
+        font-size: 0.9rem;
+    }
+    .views-table th, .views-table td {
+        padding: 0.35rem 0.5rem;
+        border-bottom: 1px solid #e0e0e0;
+        text-align: right;
+    }
+    .views-table th:first-child, .views-table td:first-child {
+        text-align: left;
+    }
+"""
+
+
+def _block(html):
+    """Dedent and trim an HTML block so joined blocks never read as Markdown code"""
+    return textwrap.dedent(html).strip()
+
+
+def minify_css(css):
+    """Strip comments and insignificant whitespace from a stylesheet"""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{}:;,>])\s*", r"\1", css)
+    return css.replace(";}", "}").strip()
+
+
+def write_stylesheet(out_dir=CSS_DIR):
+    """Write the minified stylesheet under its content hash and return its file name"""
+    css = minify_css(GLOBAL_CSS).encode("utf-8")
+    name = f"portfolio-{hashlib.sha256(css).hexdigest()[:16]}.css"
+    path = os.path.join(out_dir, name)
+    if not os.path.exists(path):
+        os.makedirs(out_dir, exist_ok=True)
+        # Write then rename so concurrent readers never see a partial file
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(css)
+        os.replace(tmp_path, path)
+    return name
+
+
+_stylesheet_name = None
+_stylesheet_lock = threading.Lock()
+
+
+def stylesheet_name():
+    """Return the hashed stylesheet's file name, writing it once per process"""
+    global _stylesheet_name
+    if _stylesheet_name is None:
+        with _stylesheet_lock:
+            if _stylesheet_name is None:
+                try:
+                    _stylesheet_name = write_stylesheet()
+                except OSError:
+                    # Read-only checkout: fall back to inlining the stylesheet
+                    _stylesheet_name = ""
+    return _stylesheet_name
+
+
+def style_tag(url_prefix="app/static/css"):
+    """Return a <link> to the hashed stylesheet, or an inline <style> if it can't be written"""
+    name = stylesheet_name()
+    if not name:
+        return f"<style>{minify_css(GLOBAL_CSS)}</style>"
+    return f'<link rel="stylesheet" href="{url_prefix}/{name}">'
+
+
+def header_html(profile):
+    """Render the name and tagline header"""
+    return (
+        f'<h1 class="main-header">{profile["name"]}</h1>'
+        f'<p class="sub-header">{profile["tagline"]}</p>'
+    )
+
+
+def profile_placeholder_html(profile):
+    """Render the CSS initials circle used when no profile image exists"""
+    return _block(f"""
+    <div class="profile-placeholder">
+        <div class="profile-initials">{profile["initials"]}</div>
+    </div>
+    """)
+
+
+def link_label(url):
+    """Return a URL without its scheme and "www." prefix, for display"""
+    return url.split("://", 1)[-1].replace("www.", "", 1)
+
+
+def section_header_html(title):
+    """Render a section heading"""
+    return f'<h2 class="section-header">{title}</h2>'
+
+
+def subheading_html(title, level=3):
+    """Render a heading inside a section"""
+    return f'<h{level} class="subheading">{title}</h{level}>'
+
+
+def metric_card_html(value, label):
+    """Render a single Key Metrics card"""
+    return _block(f"""
+    <div class="metric-card">
+        <h3>{value}</h3>
+        <p>{label}</p>
+    </div>
+    """)
+
+
+def metrics_grid_html(metrics):
+    """Render all Key Metrics cards as a single two-column grid"""
+    cards = "".join(metric_card_html(value, label) for value, label in metrics)
+    return f'<div class="metric-grid">{cards}</div>'
+
+
+def experience_card_html(exp):
+    """Render one experience entry as a complete card"""
+    bullets = "".join(f"<li>{desc}</li>" for desc in exp['description'])
+    return _block(f"""
+    <div class="experience-card">
+        <h3>{exp['title']}</h3>
+        <h4>{exp['company']}</h4>
+        <p>{exp['duration']}</p>
+        <ul>{bullets}</ul>
+    </div>
+    """)
+
+
+def skill_badges_html(skills):
+    """Render a row of skill badges"""
+    return "".join(f'<span class="skill-badge">{skill}</span>' for skill in skills)
+
+
+def skill_years_badges_html(skills, tech_index, years):
+    """Render skill badges; hovering one shows its years of use"""
+    badges = []
+    for skill in skills:
+        used_for = years.get(tech_index.canonical(skill))
+        title = f' title="{used_for:g} years of use"' if used_for else ""
+        badges.append(f'<span class="skill-badge"{title}>{skill}</span>')
+    return "".join(badges)
+
+
+def skill_category_html(category, skills, tech_index=None, years=None):
+    """Render a skill category heading followed by its badges"""
+    if tech_index is None or years is None:
+        badges = skill_badges_html(skills)
+    else:
+        badges = skill_years_badges_html(skills, tech_index, years)
+    return f'<h4 class="skill-category">{category}</h4><div>{badges}</div>'
+
+
+def project_card_html(project):
+    """Render one project entry as a complete card"""
+    return _block(f"""
+    <div class="project-card">
+        <h3>{project['title']}</h3>
+        <p class="project-description">{project['description']}</p>
+        <h4>Technologies Used:</h4>
+        <div>{skill_badges_html(project['technologies'])}</div>
+        <h4 class="impact-heading">Impact:</h4>
+        <p class="project-impact">{project['impact']}</p>
+    </div>
+    """)
+
+
+_card_cache = OrderedDict()
+_card_lock = threading.Lock()
+
+
+def cached_card_html(renderer, item):
+    """Render an item with renderer, reusing the HTML while the item is unchanged"""
+    key = (renderer.__name__, content_hash(item))
+    with _card_lock:
+        html = _card_cache.get(key)
+        if html is not None:
+            _card_cache.move_to_end(key)
+            return html
+    html = renderer(item)
+    with _card_lock:
+        _card_cache[key] = html
+        if len(_card_cache) > CARD_CACHE_SIZE:
+            _card_cache.popitem(last=False)
+    return html
+
+
+def experience_cards_html(experiences):
+    """Render every experience card as one HTML block"""
+    return "\n".join(cached_card_html(experience_card_html, exp) for exp in experiences)
+
+
+def project_cards_html(projects):
+    """Render every project card as one HTML block"""
+    return "\n".join(cached_card_html(project_card_html, project) for project in projects)
+
+
+def skill_categories_html(skills, tech_index=None, years=None):
+    """Render every skill category and its badges as one HTML block"""
+    return "".join(skill_category_html(category, items, tech_index, years)
+                   for category, items in skills.items())
+
+
+def contact_intro_html():
+    """Render the "Let's Connect" box on the Contact page"""
+    return _block("""
+    <div class="contact-info">
+        <h3>Let's Connect!</h3>
+        <p>
+            I'm always interested in discussing new opportunities,
+            data engineering challenges, and innovative projects.
+        </p>
+    </div>
+    """)
+
+
+def availability_html():
+    """Render the availability note below the contact form"""
+    return _block("""
+    <div class="note">
+        <p>Available for freelance projects and full-time opportunities</p>
+        <p>Response time: Usually within 24 hours</p>
+    </div>
+    """)
+
+
+def inbox_message_html(message):
+    """Render one stored contact message; visitor text is escaped"""
+    received = time.strftime("%Y-%m-%d %H:%M", time.localtime(message.submitted_at))
+    profile = f" · {html.escape(message.profile)}" if message.profile else ""
+    # Line breaks as <br>, since a blank line would end the HTML block in Markdown
+    body = "<br>".join(html.escape(line) for line in message.message.splitlines())
+    return _block(f"""
+    <div class="inbox-message">
+        <h4>{html.escape(message.subject)}</h4>
+        <p class="inbox-meta">{html.escape(message.name)} &lt;{html.escape(message.email)}&gt; · {received}{profile}</p>
+        <p class="inbox-body">{body}</p>
+    </div>
+    """)
+
+
+def inbox_messages_html(messages):
+    """Render a page of inbox messages as one block"""
+    return "".join(inbox_message_html(message) for message in messages)
+
+
+def views_bars_html(counts, labels=None):
+    """Render view counts per page as HTML bars, largest first"""
+    labels = labels or {}
+    highest = max(counts.values(), default=0) or 1
+    rows = "".join(
+        f'<div class="bar-row"><span class="bar-label">{html.escape(labels.get(key, key))}</span>'
+        f'<span class="bar-track"><span class="bar-fill" style="width:{100 * count / highest:.1f}%;'
+        f'background:#3498db"></span></span><span class="bar-value">{count:,}</span></div>'
+        for key, count in sorted(counts.items(), key=lambda item: item[1], reverse=True)
+    )
+    return f'<div class="bar-chart" role="img" aria-label="Views per page">{rows}</div>'
+
+
+def daily_views_table_html(daily, pages):
+    """Render views per day (rows, newest first) and page (columns) as a table"""
+    keys = [key for key, _ in pages]
+    head = "".join(f"<th>{label}</th>" for _, label in pages)
+    rows = "".join(
+        f"<tr><td>{day}</td>" + "".join(f"<td>{views.get(key, 0):,}</td>" for key in keys)
+        + f"<td>{sum(views.values()):,}</td></tr>"
+        for day, views in sorted(daily.items(), reverse=True)
+    )
+    return (f'<table class="views-table"><thead><tr><th>Day</th>{head}<th>Total</th></tr></thead>'
+            f"<tbody>{rows}</tbody></table>")
+
+
+def footer_html(profile):
+    """Render the page footer"""
+    return _block(f"""
+    <div class="note">
+        <p>&copy; 2024 {profile["name"]}. Built with ❤️ using Streamlit</p>
+    </div>
+    """)
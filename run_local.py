@@ -2,11 +2,14 @@
 """
 Local Development Script for Portfolio
 This script helps you run the portfolio locally with proper configuration.
+With --production it exports the static site and serves it with
+serve_static.py instead of starting Streamlit. With --workers N it runs N
+app processes behind proxy.py, which keeps each session on one worker.
 """
 
+import argparse
 import subprocess
 import sys
-import os
 
 def check_requirements():
     """Check if all requirements are installed"""
@@ -21,42 +24,23 @@ def check_requirements():
         print("Please run: pip install -r requirements.txt")
         return False
 
-def create_profile_placeholder():
-    """Create a profile placeholder if it doesn't exist"""
-    if not os.path.exists("profile_placeholder.jpg"):
-        try:
-            from PIL import Image, ImageDraw, ImageFont
-            
-            # Create a 400x400 image with blue background
-            size = (400, 400)
-            img = Image.new('RGB', size, color='#3498db')
-            draw = ImageDraw.Draw(img)
-            
-            # Try to use a system font
-            try:
-                font = ImageFont.truetype("arial.ttf", 120)
-            except:
-                try:
-                    font = ImageFont.truetype("/System/Library/Fonts/Arial.ttf", 120)
-                except:
-                    font = ImageFont.load_default()
-            
-            # Draw initials "AS" in white
-            text = "AS"
-            bbox = draw.textbbox((0, 0), text, font=font)
-            text_width = bbox[2] - bbox[0]
-            text_height = bbox[3] - bbox[1]
-            
-            x = (size[0] - text_width) // 2
-            y = (size[1] - text_height) // 2
-            
-            draw.text((x, y), text, fill='white', font=font)
-            img.save('profile_placeholder.jpg', 'JPEG')
-            print("✅ Created profile placeholder image")
-        except ImportError:
-            print("⚠️  Pillow not installed. Profile placeholder not created.")
-        except Exception as e:
-            print(f"⚠️  Could not create profile placeholder: {e}")
+def build_image_assets():
+    """Build the profile placeholder and image variants, skipping up-to-date ones"""
+    try:
+        from build_assets import build_assets
+        results = build_assets()
+    except ImportError:
+        print("⚠️  Pillow not installed. Image assets not built.")
+        return
+    except Exception as e:
+        print(f"⚠️  Could not build image assets: {e}")
+        return
+
+    built = [name for name, status in results if status == "built"]
+    if built:
+        print(f"✅ Built {len(built)} image asset(s)")
+    else:
+        print("✅ Image assets up to date")
 
 def run_portfolio():
     """Run the portfolio application"""
@@ -66,9 +50,9 @@ def run_portfolio():
     print("-" * 50)
     
     try:
+        # warmup.py fills the caches in the background, then runs Streamlit
         subprocess.run([
-            sys.executable, "-m", "streamlit", "run", 
-            "portfolio_app.py",
+            sys.executable, "warmup.py",
             "--server.port=8501",
             "--server.address=localhost"
         ])
@@ -77,8 +61,48 @@ def run_portfolio():
     except Exception as e:
         print(f"❌ Error running application: {e}")
 
+def run_workers(workers):
+    """Run several app processes behind the sticky-session proxy"""
+    print(f"🚀 Starting {workers} portfolio workers behind the proxy...")
+    print("📍 The app will be available at: http://localhost:8501")
+    print("-" * 50)
+
+    try:
+        subprocess.run([
+            sys.executable, "proxy.py",
+            f"--workers={workers}",
+            "--port=8501"
+        ])
+    except KeyboardInterrupt:
+        print("\n👋 Portfolio workers stopped")
+    except Exception as e:
+        print(f"❌ Error running workers: {e}")
+
+def run_production(port):
+    """Export the static site and serve it with the production server"""
+    print("🚀 Starting production server...")
+    try:
+        subprocess.run([
+            sys.executable, "serve_static.py",
+            "--export",
+            "--root", "site",
+            f"--port={port}"
+        ])
+    except KeyboardInterrupt:
+        print("\n👋 Production server stopped")
+    except Exception as e:
+        print(f"❌ Error running production server: {e}")
+
 def main():
     """Main function"""
+    parser = argparse.ArgumentParser(description="Run the portfolio locally")
+    parser.add_argument("--production", action="store_true",
+                        help="export the static site and serve it with serve_static.py")
+    parser.add_argument("--port", type=int, default=8080, help="production server port")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="app processes to run behind proxy.py (default 1: no proxy)")
+    args = parser.parse_args()
+
     print("🎯 Portfolio Development Helper")
     print("=" * 40)
     
@@ -86,11 +110,16 @@ def main():
     if not check_requirements():
         return
     
-    # Create profile placeholder
-    create_profile_placeholder()
+    # Build image assets (no-op when nothing changed)
+    build_image_assets()
     
     # Run the application
-    run_portfolio()
+    if args.production:
+        run_production(args.port)
+    elif args.workers > 1:
+        run_workers(args.workers)
+    else:
+        run_portfolio()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+Production Static Server
+Serves the exported portfolio (see export_static.py) from a single asyncio
+process. Every compressible file gets gzip and, when the brotli package is
+installed, brotli variants written next to it ahead of time, so no request
+pays for compression. Responses carry strong ETags and answer conditional
+requests with 304; file bodies go out through loop.sendfile(), which uses
+the kernel's zero-copy sendfile() where the platform supports it.
+Connections are kept alive, so one small box can hold thousands of idle
+browsers.
+
+Content-hashed assets (css/, img/) are cached by browsers for a year;
+pages are revalidated on every visit through their ETag. Files are indexed
+at startup, so restart the server after re-exporting.
+
+Usage:
+    python serve_static.py [--root site] [--port 8080] [--export]
+"""
+
+import argparse
+import asyncio
+import gzip
+import hashlib
+import mimetypes
+import os
+import re
+from collections import namedtuple
+from email.utils import formatdate
+from urllib.parse import unquote
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Compress only text formats; images are already compressed
+COMPRESSIBLE_TYPES = ("text/", "application/javascript", "application/json", "image/svg+xml")
+# Assets whose names contain a content hash, e.g. portfolio-72877f01d8a9ff9f.css
+HASHED_NAME = re.compile(r"-[0-9a-f]{16}(-\d+)?\.[a-z0-9]+$")
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+
+KEEPALIVE_TIMEOUT = 15.0
+MAX_HEADER_BYTES = 16384
+BACKLOG = 2048
+
+# path: file on disk; encodings: {"br" | "gzip": Encoded}
+StaticFile = namedtuple("StaticFile", "path size etag mime cache_control encodings")
+Encoded = namedtuple("Encoded", "path size etag")
+
+REASONS = {
+    200: "OK", 304: "Not Modified", 400: "Bad Request", 404: "Not Found",
+    405: "Method Not Allowed", 431: "Request Header Fields Too Large",
+}
+
+
+def file_sha256(path):
+    """Return the sha256 hex digest of a file's bytes"""
+    sha = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(65536), b""):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+def is_compressible(mime):
+    """Whether files of this type are worth precompressing"""
+    return mime.startswith(COMPRESSIBLE_TYPES)
+
+
+def write_compressed(path, suffix, compress):
+    """Write a compressed sibling of path unless an up-to-date one exists"""
+    target = path + suffix
+    if os.path.exists(target) and os.path.getmtime(target) >= os.path.getmtime(path):
+        return target
+    with open(path, "rb") as f:
+        data = compress(f.read())
+    tmp_path = f"{target}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, target)
+    return target
+
+
+def precompress(path, digest):
+    """Return the encoded variants of a file that are smaller than the original"""
+    compressors = [("gzip", ".gz", lambda data: gzip.compress(data, 9, mtime=0))]
+    if brotli is not None:
+        compressors.insert(0, ("br", ".br", lambda data: brotli.compress(data, quality=11)))
+    size = os.path.getsize(path)
+    encodings = {}
+    for coding, suffix, compress in compressors:
+        target = write_compressed(path, suffix, compress)
+        encoded_size = os.path.getsize(target)
+        if encoded_size < size:
+            encodings[coding] = Encoded(target, encoded_size, f'"{digest[:16]}-{coding}"')
+    return encodings
+
+
+def index_site(root):
+    """Map URL paths to files under root, precompressing as needed"""
+    files = {}
+    for directory, _, names in os.walk(root):
+        for name in names:
+            if name.endswith((".gz", ".br", ".tmp")):
+                continue
+            path = os.path.join(directory, name)
+            mime = mimetypes.guess_type(name)[0] or "application/octet-stream"
+            if mime.startswith("text/"):
+                mime += "; charset=utf-8"
+            digest = file_sha256(path)
+            encodings = precompress(path, digest) if is_compressible(mime) else {}
+            cache_control = IMMUTABLE if HASHED_NAME.search(name) else REVALIDATE
+            url = "/" + os.path.relpath(path, root).replace(os.sep, "/")
+            files[url] = StaticFile(path, os.path.getsize(path), f'"{digest[:16]}"',
+                                    mime, cache_control, encodings)
+    # Pretty URLs: / for index.html and /experience for experience.html,
+    # matching the Streamlit app's page URLs
+    for url, static_file in list(files.items()):
+        if url.endswith("/index.html"):
+            files.setdefault(url[:-len("index.html")], static_file)
+        elif url.endswith(".html"):
+            files.setdefault(url[:-len(".html")], static_file)
+    return files
+
+
+def accepted_encodings(header):
+    """Return the content codings a client accepts, from Accept-Encoding"""
+    accepted = set()
+    for part in header.split(","):
+        coding, _, params = part.strip().partition(";")
+        q = 1.0
+        match = re.search(r"q=([0-9.]+)", params)
+        if match:
+            try:
+                q = float(match.group(1))
+            except ValueError:
+                q = 0.0
+        if coding and q > 0:
+            accepted.add(coding.strip().lower())
+    return accepted
+
+
+def choose_representation(static_file, accept_encoding):
+    """Pick the smallest representation the client accepts: (coding, path, size, etag)"""
+    accepted = accepted_encodings(accept_encoding)
+    for coding in ("br", "gzip"):
+        encoded = static_file.encodings.get(coding)
+        if encoded is not None and (coding in accepted or "*" in accepted):
+            return coding, encoded.path, encoded.size, encoded.etag
+    return None, static_file.path, static_file.size, static_file.etag
+
+
+def etag_matches(if_none_match, etag):
+    """Strong comparison of an If-None-Match header against an ETag"""
+    if if_none_match.strip() == "*":
+        return True
+    return etag in (tag.strip() for tag in if_none_match.split(","))
+
+
+class StaticServer:
+    """Keep-alive HTTP/1.1 server for a prebuilt site"""
+
+    def __init__(self, root, keepalive_timeout=KEEPALIVE_TIMEOUT):
+        self.root = root
+        self.keepalive_timeout = keepalive_timeout
+        self.files = index_site(root)
+
+    async def handle(self, reader, writer):
+        """Serve requests on one connection until it closes or idles out"""
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"),
+                                                  self.keepalive_timeout)
+                except asyncio.LimitOverrunError:
+                    await self.send_error(writer, 431)
+                    break
+                except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError):
+                    break
+                keep_alive = await self.respond(head, writer)
+                if not keep_alive:
+                    break
+        except OSError:
+            # The client went away mid-response (ConnectionResetError,
+            # BrokenPipeError); nothing is left to answer
+            pass
+        finally:
+            writer.close()
+
+    async def respond(self, head, writer):
+        """Answer one request; return whether to keep the connection open"""
+        try:
+            request_line, *header_lines = head.decode("latin-1").split("\r\n")
+            method, target, version = request_line.split(" ")
+        except ValueError:
+            await self.send_error(writer, 400)
+            return False
+        headers = {}
+        for line in header_lines:
+            name, sep, value = line.partition(":")
+            if sep:
+                headers[name.strip().lower()] = value.strip()
+
+        connection = headers.get("connection", "").lower()
+        keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+        # Request bodies are never read, so one left on the connection would be
+        # parsed as the next request: answer, then close
+        if "content-length" in headers or "transfer-encoding" in headers:
+            keep_alive = False
+
+        if method not in ("GET", "HEAD"):
+            await self.send_error(writer, 405, False, {"Allow": "GET, HEAD"})
+            return False
+
+        path = unquote(target.split("?", 1)[0])
+        static_file = self.files.get(path) or self.files.get(path.rstrip("/"))
+        if static_file is None:
+            await self.send_error(writer, 404, keep_alive)
+            return keep_alive
+
+        coding, body_path, size, etag = choose_representation(
+            static_file, headers.get("accept-encoding", ""))
+        response_headers = {
+            "Content-Type": static_file.mime,
+            "ETag": etag,
+            "Cache-Control": static_file.cache_control,
+            "Vary": "Accept-Encoding",
+        }
+        if coding:
+            response_headers["Content-Encoding"] = coding
+
+        if etag_matches(headers.get("if-none-match", ""), etag):
+            await self.send_head(writer, 304, response_headers, keep_alive)
+            return keep_alive
+
+        response_headers["Content-Length"] = str(size)
+        await self.send_head(writer, 200, response_headers, keep_alive)
+        if method == "GET":
+            with open(body_path, "rb") as f:
+                # Zero-copy where the transport and platform allow it
+                await asyncio.get_running_loop().sendfile(writer.transport, f, 0, size)
+        return keep_alive
+
+    async def send_head(self, writer, status, headers, keep_alive):
+        """Write the status line and headers"""
+        lines = [f"HTTP/1.1 {status} {REASONS[status]}",
+                 f"Date: {formatdate(usegmt=True)}",
+                 f"Connection: {'keep-alive' if keep_alive else 'close'}"]
+        lines += [f"{name}: {value}" for name, value in headers.items()]
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+        await writer.drain()
+
+    async def send_error(self, writer, status, keep_alive=False, headers=None):
+        """Write a short plain-text error response"""
+        body = f"{status} {REASONS[status]}\n".encode("ascii")
+        headers = dict(headers or {}, **{
+            "Content-Type": "text/plain; charset=utf-8",
+            "Content-Length": str(len(body)),
+        })
+        await self.send_head(writer, status, headers, keep_alive)
+        writer.write(body)
+        await writer.drain()
+
+    async def serve(self, host, port):
+        """Accept connections until cancelled"""
+        server = await asyncio.start_server(self.handle, host, port, backlog=BACKLOG,
+                                            limit=MAX_HEADER_BYTES)
+        async with server:
+            await server.serve_forever()
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Serve the exported portfolio in production")
+    parser.add_argument("--root", default="site", help="exported site directory (default: site)")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=int(os.environ.get("PORT", "8080")))
+    parser.add_argument("--export", action="store_true", help="export the site to --root first")
+    args = parser.parse_args()
+
+    if args.export:
+        from export_static import export_site
+        print("📦 Exporting static portfolio...")
+        export_site(args.root)
+    if not os.path.isdir(args.root):
+        print(f"❌ {args.root}/ not found. Run: python export_static.py --out {args.root}")
+        return
+
+    server = StaticServer(args.root)
+    encodings = "brotli and gzip" if brotli is not None else "gzip (pip install brotli for brotli)"
+    print(f"🗜️  Indexed {len(server.files)} URLs, precompressed with {encodings}")
+    print(f"🚀 Serving {args.root}/ at http://{args.host}:{args.port}")
+    print("🛑 Press Ctrl+C to stop the server")
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        print("\n👋 Server stopped")
+
+
+if __name__ == "__main__":
+    main()
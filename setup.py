@@ -37,46 +37,23 @@ def install_requirements():
         print(f"❌ Failed to install requirements: {e}")
         return False
 
-def create_profile_placeholder():
-    """Create profile placeholder image"""
-    print("🖼️  Creating profile placeholder...")
+def build_image_assets():
+    """Build the profile placeholder and image variants"""
+    print("🖼️  Building image assets...")
     try:
-        from PIL import Image, ImageDraw, ImageFont
-        
-        # Create a 400x400 image with blue background
-        size = (400, 400)
-        img = Image.new('RGB', size, color='#3498db')
-        draw = ImageDraw.Draw(img)
-        
-        # Try to use a system font
-        try:
-            font = ImageFont.truetype("arial.ttf", 120)
-        except:
-            try:
-                font = ImageFont.truetype("/System/Library/Fonts/Arial.ttf", 120)
-            except:
-                font = ImageFont.load_default()
-        
-        # Draw initials "AS" in white
-        text = "AS"
-        bbox = draw.textbbox((0, 0), text, font=font)
-        text_width = bbox[2] - bbox[0]
-        text_height = bbox[3] - bbox[1]
-        
-        x = (size[0] - text_width) // 2
-        y = (size[1] - text_height) // 2
-        
-        draw.text((x, y), text, fill='white', font=font)
-        img.save('profile_placeholder.jpg', 'JPEG')
-        print("✅ Profile placeholder created")
-        return True
+        from build_assets import build_assets
+        results = build_assets()
     except ImportError:
         print("⚠️  Pillow not available. Install with: pip install Pillow")
         return False
     except Exception as e:
-        print(f"⚠️  Could not create profile placeholder: {e}")
+        print(f"⚠️  Could not build image assets: {e}")
         return False
 
+    built = sum(1 for _, status in results if status == "built")
+    print(f"✅ Image assets ready ({built} built, {len(results) - built} up to date)")
+    return True
+
 def test_application():
     """Test if the application can start"""
     print("🧪 Testing application...")
@@ -99,7 +76,7 @@ def print_next_steps():
     print()
     print("📋 Next Steps:")
     print("1. Add your profile photo as 'profile_photo.jpg' (optional)")
-    print("2. Customize your information in 'portfolio_app.py'")
+    print("2. Customize your information in the 'content/' directory")
     print("3. Test locally: python run_local.py")
     print("4. Deploy to GitHub and Streamlit Cloud")
     print()
@@ -116,7 +93,7 @@ def print_next_steps():
     print()
     print("💡 Tips:")
     print("   - Replace 'profile_placeholder.jpg' with your actual photo")
-    print("   - Update personal information in portfolio_app.py")
+    print("   - Update personal information in the content/ files")
     print("   - Customize colors and styling in the CSS section")
     print()
     print("Happy coding! 🚀")
@@ -133,8 +110,8 @@ def main():
     if not install_requirements():
         return
     
-    # Create profile placeholder
-    create_profile_placeholder()
+    # Build image assets
+    build_image_assets()
     
     # Test application
     if not test_application():
@@ -0,0 +1,82 @@
+"""
+Technology Index
+Normalizes technology names across skills, projects and experience bullets
+and maps each technology to where it is used. Spelling variants ("AWS S3",
+"Spark", "Postgres") resolve to one canonical name through
+content/aliases.json. The index is built once per content version, so
+filtering projects by a skill is a dictionary lookup rather than a rescan
+of every project.
+"""
+
+import re
+from collections import defaultdict
+
+
+def normalize(name):
+    """Return the lookup key for a technology name"""
+    return " ".join(name.split()).casefold()
+
+
+class TechIndex:
+    """Inverted index from canonical technology to projects and experience bullets"""
+
+    def __init__(self, skills, projects, experiences, aliases):
+        self._canonical = {}  # normalized name or alias -> canonical name
+        for names in skills.values():
+            for name in names:
+                self._canonical.setdefault(normalize(name), name)
+        for canonical, names in aliases.items():
+            self._canonical[normalize(canonical)] = canonical
+            for name in names:
+                self._canonical[normalize(name)] = canonical
+
+        self._projects = defaultdict(list)  # canonical -> project indices
+        for i, project in enumerate(projects):
+            for name in project["technologies"]:
+                indices = self._projects[self.canonical(name)]
+                if not indices or indices[-1] != i:
+                    indices.append(i)
+
+        # One alternation of every known spelling, longest first, so a bullet
+        # is scanned once however many technologies there are. Case-insensitive,
+        # like normalize(), so "python" and "aws s3" count as mentions too
+        spellings = set(name for names in skills.values() for name in names)
+        spellings.update(aliases)
+        spellings.update(name for names in aliases.values() for name in names)
+        spellings.update(name for project in projects for name in project["technologies"])
+        self._pattern = None
+        if spellings:
+            alternation = "|".join(re.escape(s) for s in sorted(spellings, key=len, reverse=True))
+            self._pattern = re.compile(rf"(?<![\w-])(?:{alternation})(?![\w-])", re.IGNORECASE)
+
+        self._bullets = defaultdict(list)  # canonical -> [(experience index, bullet index)]
+        for i, exp in enumerate(experiences):
+            for j, bullet in enumerate(exp["description"]):
+                for canonical in self.mentions(bullet):
+                    self._bullets[canonical].append((i, j))
+
+    def canonical(self, name):
+        """Resolve a name or alias to its canonical technology name"""
+        key = normalize(name)
+        return self._canonical.get(key, " ".join(name.split()))
+
+    def mentions(self, text):
+        """Return the canonical technologies mentioned in text, in order of appearance"""
+        if self._pattern is None:
+            return []
+        found = {}
+        for match in self._pattern.finditer(text):
+            found.setdefault(self.canonical(match.group(0)), None)
+        return list(found)
+
+    def project_indices(self, name):
+        """Indices of the projects that use a technology (or any of its aliases)"""
+        return self._projects.get(self.canonical(name), [])
+
+    def bullet_indices(self, name):
+        """(experience, bullet) indices of experience bullets mentioning a technology"""
+        return self._bullets.get(self.canonical(name), [])
+
+    def project_technologies(self):
+        """Canonical names of every technology used by at least one project"""
+        return sorted(self._projects, key=str.casefold)
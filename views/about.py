@@ -0,0 +1,32 @@
+"""About page: summary and key metrics"""
+
+import streamlit as st
+
+from downloads import show_downloads
+from instrumentation import timed
+from profiles import current_content
+from render import metrics_grid_html, section_header_html, subheading_html
+
+
+@st.fragment
+@timed("page:about")
+def about_page():
+    content = current_content()
+    st.markdown(section_header_html("About Me"), unsafe_allow_html=True)
+    
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        st.markdown(content.about_html, unsafe_allow_html=True)
+    
+    with col2:
+        # Key metrics
+        st.markdown(
+            subheading_html("Key Metrics") + metrics_grid_html(content.key_metrics),
+            unsafe_allow_html=True
+        )
+        # Built once per content version; a rerun only hands over cached bytes
+        show_downloads(content, key="about_downloads")
+
+
+about_page()
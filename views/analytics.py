@@ -0,0 +1,62 @@
+"""Analytics page: the owner's view of traffic, from the rollup tables"""
+
+import datetime
+import time
+
+import streamlit as st
+
+from analytics import get_store
+from instrumentation import timed
+from owner import require_owner
+from render import PAGES, daily_views_table_html, section_header_html, subheading_html, views_bars_html
+
+RANGES = {"Last 7 days": 7, "Last 30 days": 30, "Last 90 days": 90}
+
+
+@st.fragment
+@timed("page:analytics")
+def analytics_page():
+    st.markdown(section_header_html("Analytics"), unsafe_allow_html=True)
+    if not require_owner():
+        return
+
+    col1, col2 = st.columns([1, 1])
+    with col1:
+        days = RANGES[st.selectbox("Range", list(RANGES), key="analytics_range")]
+    with col2:
+        profile = st.text_input("Profile", key="analytics_profile",
+                                help="Leave empty for every profile; '-' for the default site")
+    profile = None if not profile else "" if profile == "-" else profile.strip()
+
+    # Days are UTC, like the rollups
+    since = time.time() - days * 86400
+    since_day = datetime.datetime.fromtimestamp(since, datetime.timezone.utc).strftime("%Y-%m-%d")
+    store = get_store()
+    daily_rows = store.daily_views(since_day, profile)
+    sessions = store.session_stats(since, profile)
+
+    page_views = sum(row.views for row in daily_rows)
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Page views", f"{page_views:,}")
+    col2.metric("Sessions", f"{sessions.sessions:,}")
+    col3.metric("Views per session", f"{sessions.views / sessions.sessions:.1f}" if sessions.sessions else "-")
+    col4.metric("Average session", f"{sessions.average_seconds / 60:.1f} min")
+
+    if not daily_rows:
+        st.info("No page views in this range yet.")
+        return
+
+    per_page = {}
+    daily = {}
+    for row in daily_rows:
+        per_page[row.page] = per_page.get(row.page, 0) + row.views
+        daily.setdefault(row.day, {})[row.page] = row.views
+
+    st.markdown(subheading_html("Views per Page"), unsafe_allow_html=True)
+    st.markdown(views_bars_html(per_page, dict(PAGES)), unsafe_allow_html=True)
+    st.markdown(subheading_html("Views per Day"), unsafe_allow_html=True)
+    st.markdown(daily_views_table_html(daily, PAGES), unsafe_allow_html=True)
+    st.caption("Updated every few seconds by the background writer.")
+
+
+analytics_page()
@@ -0,0 +1,76 @@
+"""Contact page: contact details and the message form"""
+
+import streamlit as st
+
+from contact import submit_contact
+from downloads import show_downloads
+from instrumentation import timed
+from profiles import current_content, current_profile
+from render import (
+    availability_html, contact_intro_html, link_label, section_header_html, subheading_html,
+)
+
+
+# Contact form, its own fragment so submitting reruns only the form
+@st.fragment
+@timed("contact_form")
+def contact_form():
+    st.markdown(subheading_html("Send a Message"), unsafe_allow_html=True)
+    
+    with st.form("contact_form"):
+        name = st.text_input("Name")
+        email = st.text_input("Email")
+        subject = st.text_input("Subject")
+        message = st.text_area("Message", height=150)
+        submit_button = st.form_submit_button("Send Message")
+        
+        if submit_button:
+            if name and email and subject and message:
+                # Queued for the background writer; never blocks the rerun
+                if submit_contact(name, email, subject, message, current_profile()):
+                    st.success("Thank you for your message! I'll get back to you soon.")
+                else:
+                    st.error("Too many messages right now. Please try again in a minute.")
+            else:
+                st.error("Please fill in all fields.")
+
+
+@st.fragment
+@timed("page:contact")
+def contact_page():
+    content = current_content()
+    profile = content.profile
+    st.markdown(section_header_html("Get In Touch"), unsafe_allow_html=True)
+    
+    col1, col2 = st.columns([1, 1])
+    
+    with col1:
+        st.markdown(contact_intro_html(), unsafe_allow_html=True)
+        
+        # Contact information using Streamlit components
+        st.markdown("### 📍 Contact Information")
+        st.write(profile["phone"])
+
+        st.markdown("### 📧 Email")
+        st.write(profile["email"])
+        
+        st.markdown("### 💼 LinkedIn")
+        st.markdown(f"[{link_label(profile['linkedin'])}]({profile['linkedin']})")
+        
+        st.markdown("### 🐙 GitHub")
+        st.markdown(f"[{link_label(profile['github'])}]({profile['github']})")
+        
+        st.markdown("### 📍 Location")
+        st.write(profile["location"])
+
+        show_downloads(content, key="contact_downloads")
+    
+    with col2:
+        contact_form()
+    
+    # Additional info
+    st.markdown("---")
+    st.markdown(availability_html(), unsafe_allow_html=True)
+
+
+contact_page()
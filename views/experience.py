@@ -0,0 +1,20 @@
+"""Experience page: professional timeline"""
+
+import streamlit as st
+
+from instrumentation import timed
+from pagination import paginated_cards
+from profiles import current_content
+from render import experience_cards_html, section_header_html
+
+
+@st.fragment
+@timed("page:experience")
+def experience_page():
+    content = current_content()
+    st.markdown(section_header_html("Professional Experience"), unsafe_allow_html=True)
+    # Visible part of the timeline, sent as a single block
+    paginated_cards("experience", content.experiences, experience_cards_html)
+
+
+experience_page()
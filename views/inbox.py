@@ -0,0 +1,69 @@
+"""Inbox page: the owner's view of contact form messages"""
+
+import streamlit as st
+
+from inbox import INBOX_PAGE_SIZE, get_inbox, since_timestamp
+from instrumentation import timed
+from owner import require_owner
+from render import inbox_messages_html, section_header_html
+
+RECEIVED = {"Any time": 0, "Last 7 days": 7, "Last 30 days": 30, "Last year": 365}
+
+
+def _reset_paging():
+    st.session_state.inbox_cursors = [None]
+
+
+def _older(cursor):
+    st.session_state.inbox_cursors.append(cursor)
+
+
+def _newer():
+    st.session_state.inbox_cursors.pop()
+
+
+@st.fragment
+@timed("page:inbox")
+def inbox_page():
+    st.markdown(section_header_html("Inbox"), unsafe_allow_html=True)
+    if not require_owner():
+        return
+
+    col1, col2, col3, col4 = st.columns([3, 2, 1, 1])
+    with col1:
+        search = st.text_input("Search subject and message", key="inbox_search", on_change=_reset_paging)
+    with col2:
+        sender = st.text_input("Sender email", key="inbox_sender", on_change=_reset_paging)
+    with col3:
+        profile = st.text_input("Profile", key="inbox_profile", on_change=_reset_paging,
+                                help="Leave empty for every profile; '-' for the default site")
+    with col4:
+        received = st.selectbox("Received", list(RECEIVED), key="inbox_received",
+                                on_change=_reset_paging)
+
+    # One cursor per page visited, so "Newer" steps back without an OFFSET
+    cursors = st.session_state.setdefault("inbox_cursors", [None])
+    page = get_inbox().page(
+        cursor=cursors[-1],
+        search=search,
+        sender=sender.strip(),
+        profile=None if not profile else "" if profile == "-" else profile.strip(),
+        since=since_timestamp(RECEIVED[received]),
+    )
+
+    if page.messages:
+        st.markdown(inbox_messages_html(page.messages), unsafe_allow_html=True)
+    else:
+        st.info("No messages.")
+
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col1:
+        st.button("← Newer", key="inbox_newer", disabled=len(cursors) == 1, on_click=_newer)
+    with col2:
+        st.caption(f"Page {len(cursors)} · {INBOX_PAGE_SIZE} per page")
+    with col3:
+        st.button("Older →", key="inbox_older", disabled=page.next_cursor is None,
+                  on_click=_older, args=(page.next_cursor,))
+
+
+inbox_page()
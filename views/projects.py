@@ -0,0 +1,51 @@
+"""Projects page: featured project cards, filterable by technology"""
+
+import streamlit as st
+
+from instrumentation import timed
+from pagination import paginated_cards
+from profiles import current_content
+from render import project_cards_html, section_header_html
+
+
+def used_in_experience(content, tech):
+    """Return "title at company" for each role whose bullets mention a technology"""
+    roles = []
+    for i, _ in content.tech_index.bullet_indices(tech):
+        exp = content.experiences[i]
+        role = f"{exp['title']} at {exp['company']}"
+        if role not in roles:
+            roles.append(role)
+    return roles
+
+
+@st.fragment
+@timed("page:projects")
+def projects_page():
+    content = current_content()
+    index = content.tech_index
+    st.markdown(section_header_html("Featured Projects"), unsafe_allow_html=True)
+
+    # Skills page badges link here as ?tech=<name>; aliases resolve too
+    requested = index.canonical(st.query_params.get("tech", ""))
+    options = index.project_technologies()
+    tech = st.pills(
+        "Filter by technology", options,
+        default=requested if requested in options else None,
+        key="tech_filter",
+    )
+
+    if tech:
+        st.query_params["tech"] = tech
+        projects = [content.projects[i] for i in index.project_indices(tech)]
+        roles = used_in_experience(content, tech)
+        if roles:
+            st.caption(f"{tech} also features in my work as {'; '.join(roles)}.")
+    else:
+        st.query_params.pop("tech", None)
+        projects = content.projects
+
+    paginated_cards("projects", projects, project_cards_html)
+
+
+projects_page()
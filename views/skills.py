@@ -0,0 +1,45 @@
+"""Skills page: skill categories and proficiency chart"""
+
+import streamlit as st
+
+from charts import show_chart
+from instrumentation import timed
+from profiles import current_content
+from render import section_header_html, skill_categories_html, subheading_html
+
+
+def _show_projects():
+    # Pages are registered only once the script runs, so switch from the page body
+    st.session_state.show_projects_for = st.session_state.skills_tech
+    st.session_state.skills_tech = None
+
+
+@st.fragment
+@timed("page:skills")
+def skills_page():
+    # Filter within this session: the Projects page reads ?tech= for its
+    # filter, and switching pages keeps the websocket and session state
+    tech = st.session_state.pop("show_projects_for", None)
+    if tech:
+        st.switch_page("views/projects.py", query_params={"tech": tech})
+
+    content = current_content()
+    st.markdown(section_header_html("Technical Skills"), unsafe_allow_html=True)
+    
+    # Create skill visualization
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        # Hovering a badge shows its years of use
+        st.markdown(skill_categories_html(content.skills, content.tech_index, content.skill_years),
+                    unsafe_allow_html=True)
+        st.pills("See projects using", content.tech_index.project_technologies(),
+                 key="skills_tech", on_change=_show_projects)
+    
+    with col2:
+        # Skills proficiency chart
+        st.markdown(subheading_html("Skills Proficiency", level=4), unsafe_allow_html=True)
+        show_chart("proficiency", content.proficiency)
+
+
+skills_page()
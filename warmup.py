@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Cache Warm-Up
+Builds every page's cached artifacts at server start, so the first visitor
+after a deploy or restart does not pay for them: the content store and
+technology index, the hashed stylesheet, the profile image variants, the
+experience and project cards, the Skills chart (including the pandas and
+Plotly imports when PORTFOLIO_CHART=plotly) and the résumé and vCard
+downloads. Content loads first; the rest runs in parallel on a small thread
+pool.
+
+Readiness is reported at http://127.0.0.1:9464/readyz (PORTFOLIO_METRICS_PORT
+changes the port): 503 while warming, 200 once done. Point a load
+balancer's readiness check there to hold traffic until the app is warm.
+
+Usage (the deployment entry point; extra flags go to `streamlit run`):
+    python warmup.py [--workers 4] [--server.port=8501 ...]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from instrumentation import set_readiness_check, start_metrics_server
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+APP = os.path.join(ROOT, "portfolio_app.py")
+WARMUP_WORKERS = int(os.environ.get("PORTFOLIO_WARMUP_WORKERS", "4"))
+
+logger = logging.getLogger("portfolio.warmup")
+
+Task = namedtuple("Task", "name run")
+
+
+def warm_tasks(content):
+    """Return the tasks that fill each cache used by the pages"""
+    from charts import build_chart
+    from downloads import ARTIFACTS, download
+    from images import profile_image
+    from render import experience_cards_html, project_cards_html, stylesheet_name
+
+    return [
+        Task("stylesheet", stylesheet_name),
+        Task("profile_image", profile_image),
+        Task("experience_cards", lambda: experience_cards_html(content.experiences)),
+        Task("project_cards", lambda: project_cards_html(content.projects)),
+        Task("chart", lambda: build_chart("proficiency", content.proficiency)),
+    ] + [
+        Task(f"download:{kind}", lambda kind=kind: download(kind, content))
+        for kind in ARTIFACTS
+    ]
+
+
+class Warmup:
+    """Runs the warm-up tasks once in the background and records their outcome"""
+
+    def __init__(self, max_workers=WARMUP_WORKERS):
+        self.max_workers = max_workers
+        self.ready = threading.Event()
+        self._lock = threading.Lock()
+        self._tasks = {}  # name -> {"state", "seconds", "error"}
+        self._started = None
+        self._seconds = None
+        self._thread = threading.Thread(target=self.run, name="warmup", daemon=True)
+
+    def start(self):
+        """Start warming in a background thread"""
+        self._thread.start()
+        return self
+
+    def _run_task(self, task):
+        with self._lock:
+            self._tasks[task.name] = {"state": "running"}
+        start = time.perf_counter()
+        try:
+            task.run()
+        except Exception as e:
+            # The page builds the artifact itself on first use instead
+            result = {"state": "failed", "error": f"{type(e).__name__}: {e}"}
+            logger.warning("warm-up task %s failed: %s", task.name, e)
+        else:
+            result = {"state": "done"}
+        result["seconds"] = round(time.perf_counter() - start, 3)
+        with self._lock:
+            self._tasks[task.name] = result
+        return result["state"] == "done"
+
+    def run(self):
+        """Load content, then run every other task on the thread pool"""
+        from content import load_content
+
+        self._started = time.perf_counter()
+        content_task = Task("content", load_content)
+        if not self._run_task(content_task):
+            # Without content no page can render; stay not-ready
+            return
+        tasks = warm_tasks(load_content())
+        with ThreadPoolExecutor(max_workers=self.max_workers,
+                                thread_name_prefix="warmup") as pool:
+            list(pool.map(self._run_task, tasks))
+        self._seconds = round(time.perf_counter() - self._started, 3)
+        logger.info("warm-up finished in %.2fs", self._seconds)
+        self.ready.set()
+
+    def status(self):
+        """Return (ready, details) for the readiness endpoint"""
+        with self._lock:
+            tasks = {name: dict(result) for name, result in self._tasks.items()}
+        return self.ready.is_set(), {"seconds": self._seconds, "tasks": tasks}
+
+
+_warmup = None
+_warmup_lock = threading.Lock()
+
+
+def start_warmup(max_workers=WARMUP_WORKERS, serve_readiness=True):
+    """Start the process-wide warm-up once and expose it on /readyz"""
+    global _warmup
+    if _warmup is None:
+        with _warmup_lock:
+            if _warmup is None:
+                _warmup = Warmup(max_workers)
+                set_readiness_check(_warmup.status)
+                if serve_readiness:
+                    start_metrics_server()
+                _warmup.start()
+    return _warmup
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(
+        description="Warm the portfolio's caches, then run it under Streamlit in this process",
+    )
+    parser.add_argument("--app", default=APP, help="path to portfolio_app.py")
+    parser.add_argument("--workers", type=int, default=WARMUP_WORKERS, help="warm-up threads")
+    args, streamlit_flags = parser.parse_known_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(name)s: %(message)s")
+    # Streamlit runs in this process, so its sessions share the warmed caches.
+    # Import it before warming: it imports Plotly, and so does the chart task
+    from streamlit.web import cli as stcli
+
+    # The app imports this module as "warmup"; share one warm-up with it
+    sys.modules.setdefault("warmup", sys.modules[__name__])
+    start_warmup(args.workers)
+    print("🔥 Warming caches in the background; /readyz reports when done")
+
+    sys.argv = ["streamlit", "run", args.app, *streamlit_flags]
+    sys.exit(stcli.main())
+
+
+if __name__ == "__main__":
+    main()